@@ -10,6 +10,8 @@ from app.auth.exceptions import (
 )
 from app.auth.jwks import JWKSCache
 from app.auth.jwt import JWTValidator, TokenClaims
+from app.auth.shared_cache import SharedTokenStore
+from app.auth.token_cache import TokenCache
 
 __all__ = [
     "AuthError",
@@ -17,6 +19,8 @@ __all__ = [
     "JWKSFetchError",
     "JWTValidator",
     "KeyNotFoundError",
+    "SharedTokenStore",
+    "TokenCache",
     "TokenClaims",
     "TokenExpiredError",
     "TokenInvalidError",
@@ -1,10 +1,21 @@
 """JWKS caching for Cognito public keys."""
 
+import asyncio
+import contextlib
+import fcntl
+import json
+import os
+import tempfile
 import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from pathlib import Path
 from typing import Any
 
 import httpx
 import structlog
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
 
 from app.core.config import CognitoSettings
 
@@ -12,22 +23,186 @@ from .exceptions import JWKSFetchError, KeyNotFoundError
 
 logger = structlog.get_logger(__name__)
 
+# Upper bound on remembered bogus key IDs
+_MAX_UNKNOWN_KIDS = 1024
+
+# Cross-worker refresh lock: longer than the HTTP timeout, polled briefly
+_HOST_LOCK_TIMEOUT = 15.0
+_HOST_LOCK_POLL = 0.05
+
+
+def _read_snapshot(path: Path) -> dict[str, Any] | None:
+    """Read and validate a JWKS snapshot file.
+
+    Args:
+        path: Snapshot file written by JWKSCache.
+
+    Returns:
+        Parsed snapshot, or None if missing or unreadable.
+    """
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        snapshot["fetched_at"] = float(snapshot["fetched_at"])
+        snapshot["ttl"] = float(snapshot["ttl"])
+        if not isinstance(snapshot["jwks"], dict):
+            msg = "jwks must be an object"
+            raise TypeError(msg)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning("jwks_snapshot_unreadable", path=str(path), error=str(e))
+        return None
+    return snapshot
+
+
+@contextlib.asynccontextmanager
+async def _host_lock(path: Path, timeout: float = _HOST_LOCK_TIMEOUT) -> AsyncIterator[None]:
+    """Hold an advisory file lock shared by worker processes on this host.
+
+    Polls without blocking so cancellation never strands a held lock. If the
+    lock cannot be opened or taken in time, proceeds unlocked.
+
+    Args:
+        path: Lock file path.
+        timeout: Seconds to wait for the lock.
+    """
+    try:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError as e:
+        logger.warning("jwks_host_lock_unavailable", path=str(path), error=str(e))
+        yield
+        return
+
+    locked = False
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.warning("jwks_host_lock_timeout", path=str(path))
+                    break
+                await asyncio.sleep(_HOST_LOCK_POLL)
+        yield
+    finally:
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _write_atomic(path: Path, data: str) -> None:
+    """Write a file so readers never observe a partial snapshot.
+
+    Args:
+        path: Destination file.
+        data: File contents.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _parse_max_age(cache_control: str | None) -> int | None:
+    """Extract max-age seconds from a Cache-Control header.
+
+    Args:
+        cache_control: Raw header value.
+
+    Returns:
+        max-age in seconds, 0 for no-cache/no-store, or None if absent or invalid.
+    """
+    if not cache_control:
+        return None
+
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-cache", "no-store"):
+            return 0
+        if name == "max-age":
+            try:
+                return max(int(value.strip('" ')), 0)
+            except ValueError:
+                return None
+    return None
+
 
 class JWKSCache:
     """Caches JWKS from Cognito with TTL-based expiration."""
 
-    def __init__(self, settings: CognitoSettings, ttl: int = 3600) -> None:
+    def __init__(
+        self,
+        settings: CognitoSettings,
+        ttl: int = 3600,
+        refresh_ahead: float = 60.0,
+        retry_backoff: float = 1.0,
+        max_retry_backoff: float = 60.0,
+        miss_refresh_interval: float = 30.0,
+        negative_ttl: float = 60.0,
+        respect_cache_control: bool = False,
+        min_ttl: int = 300,
+        max_ttl: int = 86400,
+        snapshot_path: str | Path | None = None,
+    ) -> None:
         """Initialize the JWKS cache.
 
         Args:
             settings: Cognito configuration.
             ttl: Cache time-to-live in seconds (default: 1 hour).
+            refresh_ahead: Seconds before TTL expiry at which the background
+                task refreshes keys (default: 60, capped at half the TTL).
+            retry_backoff: Initial background retry delay in seconds (default: 1).
+            max_retry_backoff: Upper bound for background retry delay (default: 60).
+            miss_refresh_interval: Minimum seconds between refreshes triggered by
+                an unknown key ID (default: 30).
+            negative_ttl: Seconds an unknown key ID is remembered as bogus
+                after a successful refresh did not include it (default: 60).
+            respect_cache_control: If True, take the TTL from the response's
+                Cache-Control max-age, clamped to [min_ttl, max_ttl].
+            min_ttl: Lower bound for a server-provided TTL (default: 5 minutes).
+            max_ttl: Upper bound for a server-provided TTL (default: 1 day).
+            snapshot_path: Optional file the JWKS is persisted to after each
+                refresh and loaded from at construction while within its TTL,
+                so new workers can validate tokens without a network call.
         """
         self._settings = settings
         self._ttl = ttl
+        self._refresh_ahead = refresh_ahead
+        self._retry_backoff = retry_backoff
+        self._max_retry_backoff = max_retry_backoff
+        self._miss_refresh_interval = miss_refresh_interval
+        self._negative_ttl = negative_ttl
+        self._respect_cache_control = respect_cache_control
+        self._min_ttl = min_ttl
+        self._max_ttl = max_ttl
+        self._current_ttl: float = ttl
+        self._etag: str | None = None
+        self._last_modified: str | None = None
         self._keys: dict[str, dict[str, Any]] = {}
+        self._public_keys: dict[str, Key] = {}
         self._cache_timestamp: float = 0
         self._client = httpx.AsyncClient(timeout=10.0)
+        self._rotation_listeners: list[Callable[[], None]] = []
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._background_task: asyncio.Task[None] | None = None
+        self._unknown_kids: dict[str, float] = {}
+        self._last_miss_refresh: float = 0
+        self._snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
+
+        if self._snapshot_path is not None:
+            snapshot = _read_snapshot(self._snapshot_path)
+            if snapshot is not None:
+                self._apply_snapshot(snapshot)
 
     async def get_key(self, kid: str) -> dict[str, Any]:
         """Get a public key by key ID.
@@ -42,15 +217,27 @@ class JWKSCache:
             KeyNotFoundError: Key ID not found in JWKS.
             JWKSFetchError: Failed to fetch JWKS and no cached keys.
         """
-        # Check if cache is expired or empty
-        if self._is_cache_expired():
-            await self._refresh_keys()
+        await self._ensure_key(kid)
+        return self._keys[kid]
 
-        if kid not in self._keys:
-            logger.warning("key_not_found", kid=kid, available_kids=list(self._keys.keys()))
-            raise KeyNotFoundError(kid)
+    async def get_public_key(self, kid: str) -> Key:
+        """Get a verification-ready public key by key ID.
 
-        return self._keys[kid]
+        The key object is built once per refresh, so callers only pay for
+        the signature check.
+
+        Args:
+            kid: Key ID from JWT header.
+
+        Returns:
+            Key object accepted by jose.jwt.decode.
+
+        Raises:
+            KeyNotFoundError: Key ID not found in JWKS.
+            JWKSFetchError: Failed to fetch JWKS and no cached keys.
+        """
+        await self._ensure_key(kid)
+        return self._public_keys[kid]
 
     async def refresh(self) -> None:
         """Force a cache refresh from the JWKS endpoint.
@@ -60,43 +247,312 @@ class JWKSCache:
         """
         await self._refresh_keys(force=True)
 
+    async def start(self) -> None:
+        """Warm the cache and start proactive background refresh.
+
+        While the background task runs, lookups keep serving the current keys
+        past TTL expiry instead of fetching inline. Call close() to stop it.
+        """
+        if self._background_task is not None:
+            return
+
+        # Keys loaded from a fresh snapshot are already warm
+        if self._is_cache_expired():
+            try:
+                await self._refresh_keys(force=True)
+            except JWKSFetchError:
+                # The background loop retries with backoff
+                logger.warning("jwks_warmup_failed")
+
+        self._background_task = asyncio.create_task(self._background_refresh())
+
+    def add_rotation_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked when the key set changes.
+
+        Args:
+            listener: Zero-argument callable, e.g. TokenCache.clear.
+        """
+        self._rotation_listeners.append(listener)
+
+    async def _ensure_key(self, kid: str) -> None:
+        """Make sure the cache is fresh and contains the requested key.
+
+        Args:
+            kid: Key ID from JWT header.
+
+        Raises:
+            KeyNotFoundError: Key ID not found in JWKS.
+            JWKSFetchError: Failed to fetch JWKS and no cached keys.
+        """
+        # Check if cache is expired or empty. With background refresh running,
+        # serve the current keys while the task revalidates them.
+        if self._is_cache_expired() and not (self._keys and self._is_background_refresh_running()):
+            await self._refresh_keys()
+
+        if kid not in self._public_keys:
+            await self._handle_unknown_kid(kid)
+
+    async def _handle_unknown_kid(self, kid: str) -> None:
+        """Refresh once per interval for an unknown key ID, else fail fast.
+
+        Newly rotated keys are picked up without waiting for TTL expiry, while
+        key IDs still missing after a successful refresh are remembered as
+        bogus so they cost only a dict lookup.
+
+        Args:
+            kid: Key ID not present in the cache.
+
+        Raises:
+            KeyNotFoundError: Key ID still not found.
+        """
+        # Join a refresh already in flight, such as one started by a concurrent
+        # miss for the same kid, before the rate limit turns this caller away
+        if self._refresh_task is not None:
+            await self._refresh_keys()
+            if kid in self._public_keys:
+                return
+
+        now = time.time()
+        expires_at = self._unknown_kids.get(kid)
+        if expires_at is not None:
+            if expires_at > now:
+                raise KeyNotFoundError(kid)
+            del self._unknown_kids[kid]
+
+        last_refresh = max(self._last_miss_refresh, self._cache_timestamp)
+        if now - last_refresh >= self._miss_refresh_interval:
+            self._last_miss_refresh = now
+            logger.info("jwks_refresh_on_unknown_kid", kid=kid)
+            try:
+                await self._refresh_keys(force=True)
+            except JWKSFetchError:
+                if not self._keys:
+                    raise
+                # An outage says nothing about the kid, so it is not remembered
+                logger.info("using_stale_cache", key_count=len(self._keys))
+            else:
+                if kid in self._public_keys:
+                    return
+                self._remember_unknown_kid(kid, now)
+
+        logger.warning("key_not_found", kid=kid, available_kids=list(self._keys.keys()))
+        raise KeyNotFoundError(kid)
+
+    def _remember_unknown_kid(self, kid: str, now: float) -> None:
+        """Add a key ID to the bounded negative cache."""
+        if len(self._unknown_kids) >= _MAX_UNKNOWN_KIDS:
+            self._unknown_kids = {k: exp for k, exp in self._unknown_kids.items() if exp > now}
+            while len(self._unknown_kids) >= _MAX_UNKNOWN_KIDS:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del self._unknown_kids[next(iter(self._unknown_kids))]
+
+        self._unknown_kids[kid] = now + self._negative_ttl
+
+    def _is_background_refresh_running(self) -> bool:
+        """Check whether the background refresh task is alive."""
+        return self._background_task is not None and not self._background_task.done()
+
     def _is_cache_expired(self) -> bool:
         """Check if the cache has expired."""
         if not self._keys:
             return True
-        return time.time() - self._cache_timestamp > self._ttl
+        return time.time() - self._cache_timestamp > self._current_ttl
 
     async def _refresh_keys(self, force: bool = False) -> None:
         """Refresh keys from the JWKS endpoint.
 
+        Concurrent callers share a single in-flight fetch, including its error.
+
         Args:
             force: If True, raise on failure. If False, use stale cache on failure.
 
         Raises:
             JWKSFetchError: Failed to fetch and no cached keys available.
         """
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._fetch_keys())
+            self._refresh_task.add_done_callback(self._on_refresh_done)
+
+        try:
+            # Shield so one cancelled waiter does not abort the shared fetch
+            await asyncio.shield(self._refresh_task)
+        except JWKSFetchError:
+            # If we have cached keys, use them (graceful degradation)
+            if self._keys and not force:
+                logger.info("using_stale_cache", key_count=len(self._keys))
+                return
+            raise
+
+    async def _fetch_keys(self) -> None:
+        """Fetch the JWKS document and update the cache.
+
+        With a snapshot file, workers on the same host take turns under a file
+        lock and adopt a snapshot another worker has just written instead of
+        fetching it again.
+
+        Raises:
+            JWKSFetchError: Failed to fetch JWKS.
+        """
+        if self._snapshot_path is None:
+            await self._download_keys()
+            return
+
+        async with _host_lock(self._snapshot_path.with_name(self._snapshot_path.name + ".lock")):
+            snapshot = await asyncio.to_thread(_read_snapshot, self._snapshot_path)
+            if snapshot is not None and self._is_recent_peer_snapshot(snapshot):
+                self._apply_snapshot(snapshot)
+                logger.info("jwks_snapshot_adopted", key_count=len(self._keys))
+                return
+
+            await self._download_keys()
+
+    async def _download_keys(self) -> None:
+        """Download the JWKS document from the identity provider.
+
+        Raises:
+            JWKSFetchError: Failed to fetch JWKS.
+        """
+        # Revalidate instead of re-downloading when we hold a validator
+        headers: dict[str, str] = {}
+        if self._keys:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
         try:
-            response = await self._client.get(self._settings.jwks_url)
+            response = await self._client.get(self._settings.jwks_url, headers=headers)
+
+            if response.status_code == httpx.codes.NOT_MODIFIED and self._keys:
+                self._cache_timestamp = time.time()
+                self._apply_cache_control(response.headers)
+                logger.info("jwks_not_modified", ttl=self._current_ttl)
+                await self._save_snapshot()
+                return
+
             response.raise_for_status()
 
             jwks = response.json()
+            if not isinstance(jwks, dict) or not isinstance(keys := jwks.get("keys"), list):
+                msg = "response is not a JWKS document"
+                raise ValueError(msg)
+            if not all(isinstance(key, dict) for key in keys):
+                msg = "JWKS keys must be objects"
+                raise ValueError(msg)
             self._update_cache(jwks)
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._apply_cache_control(response.headers)
 
             logger.info(
                 "jwks_refreshed",
                 key_count=len(self._keys),
-                ttl=self._ttl,
+                ttl=self._current_ttl,
             )
+            await self._save_snapshot()
 
         except httpx.HTTPError as e:
             logger.warning("jwks_fetch_failed", error=str(e), url=self._settings.jwks_url)
+            raise JWKSFetchError(f"Failed to fetch JWKS: {e}") from e
+        except ValueError as e:
+            # Includes JSONDecodeError from a non-JSON body
+            logger.warning("jwks_invalid_response", error=str(e), url=self._settings.jwks_url)
+            raise JWKSFetchError(f"Invalid JWKS response: {e}") from e
 
-            # If we have cached keys, use them (graceful degradation)
-            if self._keys and not force:
-                logger.info("using_stale_cache", key_count=len(self._keys))
-                return
+    def _apply_cache_control(self, headers: Mapping[str, str]) -> None:
+        """Take the TTL from Cache-Control when configured to.
 
-            raise JWKSFetchError(f"Failed to fetch JWKS: {e}") from e
+        Args:
+            headers: Response headers from the JWKS endpoint.
+        """
+        if not self._respect_cache_control:
+            return
+
+        max_age = _parse_max_age(headers.get("Cache-Control"))
+        if max_age is None:
+            self._current_ttl = self._ttl
+            return
+
+        self._current_ttl = min(max(max_age, self._min_ttl), self._max_ttl)
+
+    def _apply_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Populate the cache from a snapshot if it is still within its TTL.
+
+        Args:
+            snapshot: Parsed snapshot written by _save_snapshot.
+        """
+        fetched_at = snapshot["fetched_at"]
+        ttl = snapshot["ttl"]
+        if time.time() - fetched_at > ttl:
+            logger.info("jwks_snapshot_expired", path=str(self._snapshot_path))
+            return
+
+        self._update_cache(snapshot["jwks"])
+        self._cache_timestamp = fetched_at
+        self._current_ttl = ttl
+        self._etag = snapshot.get("etag")
+        self._last_modified = snapshot.get("last_modified")
+        logger.info("jwks_snapshot_loaded", path=str(self._snapshot_path), key_count=len(self._keys))
+
+    def _is_recent_peer_snapshot(self, snapshot: dict[str, Any]) -> bool:
+        """Check whether another worker refreshed the snapshot moments ago.
+
+        Only snapshots newer than our keys and younger than the unknown-kid
+        refresh interval are adopted, so rotation pickup is not delayed.
+        """
+        fetched_at = snapshot["fetched_at"]
+        return fetched_at > self._cache_timestamp and time.time() - fetched_at < self._miss_refresh_interval
+
+    async def _save_snapshot(self) -> None:
+        """Persist the current keys to the snapshot file, if configured."""
+        if self._snapshot_path is None:
+            return
+
+        snapshot = {
+            "fetched_at": self._cache_timestamp,
+            "ttl": self._current_ttl,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "jwks": {"keys": list(self._keys.values())},
+        }
+        try:
+            await asyncio.to_thread(_write_atomic, self._snapshot_path, json.dumps(snapshot))
+        except OSError as e:
+            logger.warning("jwks_snapshot_write_failed", path=str(self._snapshot_path), error=str(e))
+
+    async def _background_refresh(self) -> None:
+        """Refresh keys shortly before TTL expiry, retrying with backoff."""
+        backoff = self._retry_backoff
+        while True:
+            await asyncio.sleep(self._seconds_until_refresh())
+            try:
+                await self._refresh_keys(force=True)
+            except JWKSFetchError:
+                logger.warning("jwks_background_refresh_failed", retry_in=backoff)
+            except Exception:
+                # Keep going: lookups rely on this task while it is alive
+                logger.exception("jwks_background_refresh_error", retry_in=backoff)
+            else:
+                backoff = self._retry_backoff
+                continue
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self._max_retry_backoff)
+
+    def _seconds_until_refresh(self) -> float:
+        """Seconds until the background task should next refresh."""
+        if not self._keys:
+            return 0.0
+        lead = min(self._refresh_ahead, self._current_ttl / 2)
+        refresh_at = self._cache_timestamp + self._current_ttl - lead
+        return max(0.0, refresh_at - time.time())
+
+    def _on_refresh_done(self, task: "asyncio.Task[None]") -> None:
+        """Clear the in-flight refresh once it settles."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        # Mark the exception retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
 
     def _update_cache(self, jwks: dict[str, Any]) -> None:
         """Update the cache with new JWKS data.
@@ -104,14 +560,39 @@ class JWKSCache:
         Args:
             jwks: JWKS response with keys array.
         """
-        self._keys = {}
+        keys: dict[str, dict[str, Any]] = {}
+        public_keys: dict[str, Key] = {}
         for key in jwks.get("keys", []):
             kid = key.get("kid")
-            if kid:
-                self._keys[kid] = key
+            if not kid:
+                continue
+            try:
+                public_keys[kid] = jwk.construct(key, key.get("alg", "RS256"))
+            except JWKError as e:
+                logger.warning("jwk_construct_failed", kid=kid, error=str(e))
+                continue
+            keys[kid] = key
 
+        rotated = bool(self._keys) and keys != self._keys
+        self._keys = keys
+        self._public_keys = public_keys
         self._cache_timestamp = time.time()
 
+        if rotated:
+            logger.info("jwks_keys_rotated", kids=list(keys.keys()))
+            for listener in self._rotation_listeners:
+                listener()
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop background refresh and close the HTTP client."""
+        if self._background_task is not None:
+            self._background_task.cancel()
+            await asyncio.gather(self._background_task, return_exceptions=True)
+            self._background_task = None
+
+        # The shared fetch is shielded from its waiters; stop it explicitly
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+
         await self._client.aclose()
@@ -1,15 +1,22 @@
 """JWT validation for Cognito tokens."""
 
+import asyncio
+import json
+import multiprocessing
+from collections.abc import Awaitable, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, get_args
 
 import structlog
-from jose import JWTError, jwt
-from jose.exceptions import ExpiredSignatureError
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
+from jose.exceptions import ExpiredSignatureError, JWKError
 
 from app.core.config import CognitoSettings
 
 from .exceptions import (
+    AuthError,
     KeyNotFoundError,
     TokenExpiredError,
     TokenInvalidError,
@@ -18,11 +25,56 @@ from .exceptions import (
 
 if TYPE_CHECKING:
     from .jwks import JWKSCache
+    from .token_cache import TokenCache
 
 logger = structlog.get_logger(__name__)
 
+# Where RS256 signature verification runs
+VerificationMode = Literal["inline", "thread", "process"]
 
-@dataclass
+# Per-process cache of keys built from JWK dicts shipped to pool workers
+_worker_keys: dict[str, Key] = {}
+_MAX_WORKER_KEYS = 16
+
+
+def _worker_key(jwk_dict: Mapping[str, Any]) -> Key:
+    """Build (or reuse) a key object inside a process pool worker."""
+    cache_key = json.dumps(jwk_dict, sort_keys=True)
+    key = _worker_keys.get(cache_key)
+    if key is None:
+        if len(_worker_keys) >= _MAX_WORKER_KEYS:
+            _worker_keys.clear()
+        key = jwk.construct(dict(jwk_dict), jwk_dict.get("alg", "RS256"))
+        _worker_keys[cache_key] = key
+    return key
+
+
+def _decode_payload(token: str, key: Key | Mapping[str, Any], audience: str, issuer: str) -> dict[str, Any]:
+    """Verify a token's signature and decode its payload.
+
+    Module-level so it can be submitted to a process pool.
+    """
+    if isinstance(key, Mapping):
+        key = _worker_key(key)
+    return jwt.decode(
+        token,
+        key,
+        algorithms=["RS256"],
+        audience=audience,
+        issuer=issuer,
+        options={"require_exp": True, "require_iat": True},
+    )
+
+
+async def _capture_auth_error[T](awaitable: Awaitable[T]) -> T | AuthError:
+    """Await and return the result, or the AuthError it raised."""
+    try:
+        return await awaitable
+    except AuthError as e:
+        return e
+
+
+@dataclass(frozen=True)
 class TokenClaims:
     """Extracted claims from a validated JWT."""
 
@@ -40,16 +92,45 @@ class JWTValidator:
         self,
         settings: CognitoSettings,
         jwks_cache: "JWKSCache | None" = None,
+        token_cache: "TokenCache | None" = None,
+        verification_mode: VerificationMode = "inline",
+        max_workers: int | None = None,
     ) -> None:
         """Initialize the validator with Cognito settings.
 
         Args:
             settings: Cognito configuration including region, pool ID, and client ID.
             jwks_cache: Optional JWKSCache instance for key retrieval.
+            token_cache: Optional TokenCache of validated claims. Cleared when
+                the JWKS cache rotates keys.
+            verification_mode: Where signature verification runs: "inline" on the
+                event loop, or in a bounded "thread" or "process" pool.
+            max_workers: Pool size for thread/process modes (default: executor default).
+
+        Raises:
+            ValueError: Unknown verification mode.
         """
+        if verification_mode not in get_args(VerificationMode):
+            msg = f"Unknown verification_mode: {verification_mode}"
+            raise ValueError(msg)
+
         self._settings = settings
         self._jwks_cache_instance = jwks_cache
+        self._token_cache = token_cache
         self._inline_jwks: dict[str, Any] | None = None
+        self._verification_mode = verification_mode
+        self._executor: Executor | None = None
+
+        if verification_mode == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jwt-verify")
+        elif verification_mode == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        if token_cache is not None and jwks_cache is not None:
+            jwks_cache.add_rotation_listener(token_cache.clear)
 
     async def validate_token(self, token: str) -> TokenClaims:
         """Validate a JWT and return extracted claims.
@@ -66,49 +147,56 @@ class JWTValidator:
             TokenSignatureError: Signature validation failed.
             KeyNotFoundError: Key ID not found in JWKS.
         """
-        # Basic token structure check
-        if not token or token.count(".") != 2:
-            raise TokenInvalidError("Malformed token")
+        # Skip verification for tokens already validated and not yet expired
+        cached = self._get_cached_claims(token)
+        if cached is not None:
+            return cached
 
-        try:
-            # Get the key ID from token header
-            unverified_header = jwt.get_unverified_header(token)
-            kid = unverified_header.get("kid")
-            if not kid:
-                raise TokenInvalidError("Token missing key ID")
-
-            # Get the signing key
-            key = await self._get_signing_key(kid)
-
-            # Verify and decode the token
-            payload = jwt.decode(
-                token,
-                key,
-                algorithms=["RS256"],
-                audience=self._settings.cognito_app_client_id,
-                issuer=self._settings.issuer,
-                options={"require_exp": True, "require_iat": True},
-            )
+        kid = self._get_kid(token)
+        key = await self._get_verification_key(kid)
+        return await self._verify_token(token, key)
 
-            # Validate required claims
-            return self._extract_claims(payload)
+    async def validate_tokens(self, tokens: Sequence[str]) -> list[TokenClaims | AuthError]:
+        """Validate many tokens at once.
 
-        except ExpiredSignatureError as e:
-            logger.warning("token_expired", error=str(e))
-            raise TokenExpiredError() from e
-        except JWTError as e:
-            error_msg = str(e).lower()
-            if "signature" in error_msg:
-                logger.warning("signature_invalid", error=str(e))
-                raise TokenSignatureError() from e
-            if "issuer" in error_msg or "iss" in error_msg:
-                logger.warning("invalid_issuer", error=str(e))
-                raise TokenInvalidError("Invalid issuer") from e
-            if "audience" in error_msg or "aud" in error_msg:
-                logger.warning("invalid_audience", error=str(e))
-                raise TokenInvalidError("Invalid audience") from e
-            logger.warning("token_invalid", error=str(e))
-            raise TokenInvalidError(str(e)) from e
+        Identical tokens are validated once, each distinct key ID is resolved
+        once, and signatures are verified concurrently (in parallel when a
+        worker pool is configured).
+
+        Args:
+            tokens: Raw JWT strings (without "Bearer " prefix).
+
+        Returns:
+            For each input token, in order, its TokenClaims or the AuthError
+            that validate_token would have raised.
+        """
+        results: dict[str, TokenClaims | AuthError] = {}
+        token_kids: dict[str, str] = {}
+
+        for token in dict.fromkeys(tokens):
+            cached = self._get_cached_claims(token)
+            if cached is not None:
+                results[token] = cached
+                continue
+            try:
+                token_kids[token] = self._get_kid(token)
+            except AuthError as e:
+                results[token] = e
+
+        kids = list(dict.fromkeys(token_kids.values()))
+        resolved = await asyncio.gather(*(_capture_auth_error(self._get_verification_key(kid)) for kid in kids))
+        keys = dict(zip(kids, resolved, strict=True))
+
+        async def verify(token: str, kid: str) -> TokenClaims | AuthError:
+            key = keys[kid]
+            if isinstance(key, AuthError):
+                return key
+            return await _capture_auth_error(self._verify_token(token, key))
+
+        verified = await asyncio.gather(*(verify(token, kid) for token, kid in token_kids.items()))
+        results.update(zip(token_kids, verified, strict=True))
+
+        return [results[token] for token in tokens]
 
     async def get_user_id(self, token: str) -> str:
         """Extract just the user ID from a token.
@@ -125,23 +213,173 @@ class JWTValidator:
         claims = await self.validate_token(token)
         return claims.sub
 
-    async def _get_signing_key(self, kid: str) -> dict[str, Any]:
+    def _get_cached_claims(self, token: str) -> TokenClaims | None:
+        """Return cached claims for a previously validated token, if any."""
+        if self._token_cache is None:
+            return None
+        return self._token_cache.get(token)
+
+    def _get_kid(self, token: str) -> str:
+        """Check token structure and read the key ID from its header.
+
+        Args:
+            token: Raw JWT string.
+
+        Returns:
+            The kid header value.
+
+        Raises:
+            TokenInvalidError: Token is malformed or has no key ID.
+        """
+        # Basic token structure check
+        if not token or token.count(".") != 2:
+            raise TokenInvalidError("Malformed token")
+
+        try:
+            unverified_header = jwt.get_unverified_header(token)
+        except JWTError as e:
+            raise self._map_jwt_error(e) from e
+
+        kid = unverified_header.get("kid")
+        if not kid:
+            raise TokenInvalidError("Token missing key ID")
+        return kid
+
+    async def _get_verification_key(self, kid: str) -> Key | dict[str, Any]:
+        """Get the key in the form the configured verification mode needs.
+
+        Process workers need a picklable JWK dict; other modes use the
+        pre-built key object.
+        """
+        if self._verification_mode == "process":
+            return await self._get_signing_jwk(kid)
+        return await self._get_signing_key(kid)
+
+    async def _verify_token(self, token: str, key: Key | dict[str, Any]) -> TokenClaims:
+        """Verify a token with a resolved key and extract its claims.
+
+        Args:
+            token: Raw JWT string.
+            key: Key object, or JWK dict in process mode.
+
+        Returns:
+            TokenClaims with validated user information.
+
+        Raises:
+            TokenExpiredError: Token has expired.
+            TokenInvalidError: Token is invalid or missing required claims.
+            TokenSignatureError: Signature validation failed.
+        """
+        try:
+            payload = await self._verify(token, key)
+        except JWTError as e:
+            raise self._map_jwt_error(e) from e
+
+        # Validate required claims
+        claims = self._extract_claims(payload)
+
+        if self._token_cache is not None:
+            self._token_cache.put(token, claims)
+
+        return claims
+
+    def _map_jwt_error(self, error: JWTError) -> AuthError:
+        """Translate a jose error into the matching auth exception."""
+        if isinstance(error, ExpiredSignatureError):
+            logger.warning("token_expired", error=str(error))
+            return TokenExpiredError()
+
+        error_msg = str(error).lower()
+        if "signature" in error_msg:
+            logger.warning("signature_invalid", error=str(error))
+            return TokenSignatureError()
+        if "issuer" in error_msg or "iss" in error_msg:
+            logger.warning("invalid_issuer", error=str(error))
+            return TokenInvalidError("Invalid issuer")
+        if "audience" in error_msg or "aud" in error_msg:
+            logger.warning("invalid_audience", error=str(error))
+            return TokenInvalidError("Invalid audience")
+        logger.warning("token_invalid", error=str(error))
+        return TokenInvalidError(str(error))
+
+    def close(self) -> None:
+        """Shut down the verification worker pool, if any."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _verify(self, token: str, key: Key | dict[str, Any]) -> dict[str, Any]:
+        """Run signature verification according to the configured mode.
+
+        Args:
+            token: Raw JWT string.
+            key: Key object, or JWK dict in process mode.
+
+        Returns:
+            Decoded token payload.
+
+        Raises:
+            JWTError: Verification or claim validation failed.
+        """
+        args = (token, key, self._settings.cognito_app_client_id, self._settings.issuer)
+        if self._executor is None:
+            return _decode_payload(*args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _decode_payload, *args)
+
+    async def _get_signing_key(self, kid: str) -> Key:
         """Get the signing key for a given key ID.
 
         Args:
             kid: Key ID from JWT header.
 
         Returns:
-            JWK dict for signature verification.
+            Public key object for signature verification.
 
         Raises:
             KeyNotFoundError: Key ID not in JWKS.
+            TokenInvalidError: Key material could not be loaded.
         """
-        # Use JWKSCache if available
+        # Use JWKSCache if available (keys are pre-built once per refresh)
         if self._jwks_cache_instance is not None:
-            return await self._jwks_cache_instance.get_key(kid)
+            return await self._jwks_cache_instance.get_public_key(kid)
 
         # Fall back to inline JWKS (for testing)
+        key = await self._get_inline_jwk(kid)
+        try:
+            return jwk.construct(key, key.get("alg", "RS256"))
+        except JWKError as e:
+            raise TokenInvalidError("Invalid signing key") from e
+
+    async def _get_signing_jwk(self, kid: str) -> dict[str, Any]:
+        """Get the raw JWK for a given key ID.
+
+        Args:
+            kid: Key ID from JWT header.
+
+        Returns:
+            JWK dict for signature verification in a worker process.
+
+        Raises:
+            KeyNotFoundError: Key ID not in JWKS.
+        """
+        if self._jwks_cache_instance is not None:
+            return await self._jwks_cache_instance.get_key(kid)
+        return await self._get_inline_jwk(kid)
+
+    async def _get_inline_jwk(self, kid: str) -> dict[str, Any]:
+        """Look up a JWK in the inline JWKS (for testing).
+
+        Args:
+            kid: Key ID from JWT header.
+
+        Returns:
+            JWK dict for the requested key.
+
+        Raises:
+            KeyNotFoundError: Key ID not in JWKS.
+        """
         jwks = await self._fetch_jwks()
 
         for key in jwks.get("keys", []):
@@ -0,0 +1,249 @@
+"""Host-wide store of validated token claims shared across worker processes."""
+
+import contextlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Trim expired and excess rows every N writes
+_TRIM_INTERVAL = 256
+
+# Writes queued beyond this are dropped rather than delaying requests
+_MAX_PENDING_WRITES = 1024
+
+# Writes applied per transaction by the writer thread
+_WRITE_BATCH_SIZE = 64
+
+# The writer thread may wait for other workers' locks; request paths never do
+_WRITER_BUSY_TIMEOUT = 1.0
+
+_CLEAR = object()
+_STOP = object()
+
+
+class SharedTokenStore:
+    """SQLite-backed claims store readable by every worker on one host.
+
+    Place the file on tmpfs (e.g. ``/dev/shm``) so lookups never touch disk.
+    The file is created with mode 0600: anyone able to write it could inject
+    claims, so it must only be accessible to the application user.
+
+    Lookups never wait for a lock: one that would is treated as a miss.
+    Writes and clears are queued and applied by a background thread, in
+    order, so put() and clear() return without touching the database.
+
+    Any database failure disables the store, and TokenCache falls back to
+    per-process caching.
+    """
+
+    def __init__(self, path: str | Path, max_entries: int = 10000) -> None:
+        """Open (or create) the shared store.
+
+        Args:
+            path: Database file shared by all workers on the host.
+            max_entries: Maximum number of stored tokens (default: 10000).
+        """
+        self._path = Path(path)
+        self._max_entries = max_entries
+        self._writes = 0
+        self._conn: sqlite3.Connection | None = None
+        self._writer_conn: sqlite3.Connection | None = None
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=_MAX_PENDING_WRITES)
+        self._writer: threading.Thread | None = None
+
+        try:
+            self._writer_conn = self._connect(busy_timeout=_WRITER_BUSY_TIMEOUT)
+            self._conn = self._connect(busy_timeout=0)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("shared_token_store_unavailable", path=str(self._path), error=str(e))
+            self.close()
+            return
+
+        self._writer = threading.Thread(target=self._write_loop, name="shared-token-store-writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def available(self) -> bool:
+        """Whether the shared store is usable."""
+        return self._conn is not None
+
+    def get(self, digest: bytes) -> str | None:
+        """Fetch serialized claims for a token digest.
+
+        Args:
+            digest: Token digest.
+
+        Returns:
+            Serialized claims, or None if absent, expired, or the store failed.
+        """
+        if self._conn is None:
+            return None
+
+        try:
+            row = self._conn.execute(
+                "SELECT claims FROM tokens WHERE digest = ? AND expires_at > ?",
+                (digest, time.time()),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Busy under write contention; treat as a miss
+            return None
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+
+        return row[0] if row else None
+
+    def put(self, digest: bytes, claims: str, expires_at: float) -> None:
+        """Queue serialized claims to be stored until the token expires.
+
+        Args:
+            digest: Token digest.
+            claims: Serialized claims.
+            expires_at: Unix time after which the entry is invalid.
+        """
+        if self._conn is None:
+            return
+
+        try:
+            self._queue.put_nowait((digest, claims, expires_at))
+        except queue.Full:
+            # Writer is behind; the token is still cached locally
+            return
+
+    def clear(self) -> None:
+        """Queue dropping all stored tokens for every worker.
+
+        Applied after any writes already queued by this process.
+        """
+        if self._conn is None:
+            return
+
+        self._queue.put(_CLEAR)
+
+    def flush(self) -> None:
+        """Wait until queued writes and clears have been applied."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Apply queued writes, then close the database connections."""
+        if self._writer is not None:
+            if self._writer.is_alive():
+                self._queue.put(_STOP)
+                self._writer.join()
+            self._writer = None
+
+        if self._writer_conn is not None:
+            self._writer_conn.close()
+            self._writer_conn = None
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _write_loop(self) -> None:
+        """Apply queued operations in batches until told to stop.
+
+        Runs on the writer thread, which owns the writer connection.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < _WRITE_BATCH_SIZE and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._apply([op for op in batch if op is not _STOP])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if batch[-1] is _STOP:
+                if self._writer_conn is not None:
+                    self._writer_conn.close()
+                    self._writer_conn = None
+                return
+
+    def _apply(self, batch: list[object]) -> None:
+        """Apply a batch of queued operations in one transaction."""
+        conn = self._writer_conn
+        if conn is None or not batch:
+            return
+
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for op in batch:
+                    if op is _CLEAR:
+                        conn.execute("DELETE FROM tokens")
+                    else:
+                        conn.execute("INSERT OR REPLACE INTO tokens (digest, claims, expires_at) VALUES (?, ?, ?)", op)
+                        self._writes += 1
+                        if self._writes % _TRIM_INTERVAL == 0:
+                            self._trim(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        except sqlite3.OperationalError as e:
+            # Busy under write contention for too long; drop the batch
+            logger.warning("shared_token_store_write_skipped", count=len(batch), error=str(e))
+        except sqlite3.Error as e:
+            logger.warning("shared_token_store_disabled", path=str(self._path), error=str(e))
+            self._writer_conn = None
+            conn.close()
+
+    def _connect(self, busy_timeout: float) -> sqlite3.Connection:
+        """Create the database file with owner-only permissions and open it.
+
+        Args:
+            busy_timeout: Seconds to wait for another connection's lock.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        os.close(os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600))
+
+        # Autocommit; generous timeout while workers race to create the schema
+        conn = sqlite3.connect(self._path, timeout=1.0, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                "digest BLOB PRIMARY KEY, claims TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """Delete expired rows and the soonest-expiring rows over the limit."""
+        conn.execute("DELETE FROM tokens WHERE expires_at <= ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM tokens WHERE digest IN ("
+            "SELECT digest FROM tokens ORDER BY expires_at "
+            "LIMIT MAX((SELECT COUNT(*) FROM tokens) - ?, 0))",
+            (self._max_entries,),
+        )
+
+    def _disable(self, error: Exception) -> None:
+        """Stop using the store after an unexpected database error."""
+        logger.warning("shared_token_store_disabled", path=str(self._path), error=str(error))
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        # Lookups must not wait for the writer; it closes its connection on stop
+        if self._writer is not None:
+            with contextlib.suppress(queue.Full):
+                self._queue.put_nowait(_STOP)
@@ -0,0 +1,126 @@
+"""LRU cache of validated token claims."""
+
+import dataclasses
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from .jwt import TokenClaims
+
+if TYPE_CHECKING:
+    from .shared_cache import SharedTokenStore
+
+
+class TokenCache:
+    """Bounded LRU of validated TokenClaims keyed by a digest of the token.
+
+    Entries expire at the token's own ``exp`` claim. Only tokens that passed
+    full validation are stored, so failures always take the slow path. An
+    optional SharedTokenStore adds a host-wide tier behind the local LRU.
+    """
+
+    def __init__(self, max_size: int = 1024, shared_store: "SharedTokenStore | None" = None) -> None:
+        """Initialize the token cache.
+
+        Args:
+            max_size: Maximum number of cached tokens (default: 1024).
+            shared_store: Optional store shared with other worker processes.
+
+        Raises:
+            ValueError: max_size is not positive.
+        """
+        if max_size <= 0:
+            msg = "max_size must be positive"
+            raise ValueError(msg)
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        self._shared_store = shared_store
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of cached tokens."""
+        return self._max_size
+
+    def get(self, token: str) -> TokenClaims | None:
+        """Look up the claims for a previously validated token.
+
+        Args:
+            token: Raw JWT string.
+
+        Returns:
+            Cached TokenClaims, or None if absent or expired.
+        """
+        digest = self._digest(token)
+        claims = self._entries.get(digest)
+
+        if claims is None:
+            claims = self._get_shared(digest)
+            if claims is None:
+                self.misses += 1
+                return None
+            self.shared_hits += 1
+            self._store_local(digest, claims)
+
+        if claims.exp <= time.time():
+            del self._entries[digest]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return claims
+
+    def put(self, token: str, claims: TokenClaims) -> None:
+        """Store the claims of a validated token.
+
+        Args:
+            token: Raw JWT string.
+            claims: Claims extracted from the validated token.
+        """
+        digest = self._digest(token)
+        self._store_local(digest, claims)
+
+        if self._shared_store is not None:
+            self._shared_store.put(digest, json.dumps(dataclasses.asdict(claims)), claims.exp)
+
+    def clear(self) -> None:
+        """Drop all cached tokens, including the shared tier."""
+        self._entries.clear()
+        if self._shared_store is not None:
+            self._shared_store.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._entries)
+
+    def _store_local(self, digest: bytes, claims: TokenClaims) -> None:
+        """Insert into the local LRU, evicting the oldest entries when full."""
+        self._entries[digest] = claims
+        self._entries.move_to_end(digest)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def _get_shared(self, digest: bytes) -> TokenClaims | None:
+        """Look up claims validated by another worker on this host."""
+        if self._shared_store is None:
+            return None
+
+        data = self._shared_store.get(digest)
+        if data is None:
+            return None
+
+        try:
+            return TokenClaims(**json.loads(data))
+        except (ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Hash a token so raw credentials are not kept as dict keys."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
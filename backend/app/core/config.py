@@ -16,12 +16,30 @@ Optional environment variables (with defaults):
 - LOG_LEVEL: Logging level (default: INFO)
 - MAX_TOOL_CALLS: Max tool calls per agent turn (default: 20)
 - JWKS_CACHE_TTL: JWKS cache TTL in seconds (default: 3600)
+- DB_POOL_MODE: "fixed" or "auto" pool sizing (default: fixed)
+- DB_POOL_SIZE: Base pool connections per worker in fixed mode (default: 5)
+- DB_MAX_OVERFLOW: Burst connections per worker in fixed mode (default: 15)
+- DB_POOL_TIMEOUT: Seconds to wait for a pooled connection (default: 30)
+- DB_POOL_RECYCLE: Max connection age in seconds, -1 disables (default: -1)
+- DB_HOST_CONNECTION_BUDGET: Connections per host in auto mode (default: 100)
+- DB_WORKERS_PER_HOST: Workers sharing the budget, 0 to detect (default: 0)
+- DB_LIVENESS_CHECK: "pre_ping" on every checkout or "idle" (default: pre_ping)
+- DB_IDLE_PING_THRESHOLD: Idle seconds before a connection is pinged in idle
+  mode (default: 30)
+- DB_TRANSACTION_POOLER: Connect through PgBouncer in transaction mode (default: false)
+- DB_REPLICA_URL: Read replica connection string (default: unset, reads use primary)
+- DB_READ_YOUR_WRITES_WINDOW: Seconds a client's reads stay on the primary after
+  it writes (default: 5)
+- DB_PARTITIONS_AHEAD: Months of messages partitions created in advance (default: 3)
+- DB_MESSAGE_RETENTION_MONTHS: Months of messages kept before their partitions
+  are dropped, 0 keeps all (default: 0)
 """
 
+import os
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import SecretStr, field_validator
+from pydantic import SecretStr, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -66,6 +84,92 @@ class BedrockSettings(BaseSettings):
     model_config = {"env_prefix": "", "case_sensitive": False}
 
 
+class DatabaseSettings(BaseSettings):
+    """Database connection pool configuration.
+
+    In "auto" mode the per-host connection budget is split evenly across the
+    workers on the host, so the fleet stays within the database's limit.
+    """
+
+    db_pool_mode: Literal["fixed", "auto"] = "fixed"
+    db_pool_size: int = 5
+    db_max_overflow: int = 15
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1  # -1 disables recycling
+    db_host_connection_budget: int = 100
+    db_workers_per_host: int = 0  # 0 = WEB_CONCURRENCY or CPU count
+    db_liveness_check: Literal["pre_ping", "idle"] = "pre_ping"
+    db_idle_ping_threshold: float = 30.0
+    db_transaction_pooler: bool = False  # PgBouncer (or RDS Proxy) in transaction mode
+    db_replica_url: SecretStr | None = None  # Optional - read-only sessions
+    db_read_your_writes_window: float = 5.0
+    db_partitions_ahead: int = 3
+    db_message_retention_months: int = 0  # 0 = keep messages forever
+
+    @field_validator("db_pool_size", "db_host_connection_budget")
+    @classmethod
+    def validate_positive(cls, v: int, info: ValidationInfo) -> int:
+        """Validate pool size and connection budget are positive."""
+        if v <= 0:
+            msg = f"{info.field_name} must be positive"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("db_max_overflow", "db_workers_per_host", "db_partitions_ahead", "db_message_retention_months")
+    @classmethod
+    def validate_non_negative(cls, v: int, info: ValidationInfo) -> int:
+        """Validate overflow, worker count and partition settings are not negative."""
+        if v < 0:
+            msg = f"{info.field_name} must not be negative"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("db_pool_timeout", "db_idle_ping_threshold")
+    @classmethod
+    def validate_positive_seconds(cls, v: float, info: ValidationInfo) -> float:
+        """Validate pool timeout and idle ping threshold are positive."""
+        if v <= 0:
+            msg = f"{info.field_name} must be positive"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("db_read_your_writes_window")
+    @classmethod
+    def validate_read_your_writes_window(cls, v: float) -> float:
+        """Validate read_your_writes_window is not negative."""
+        if v < 0:
+            msg = "db_read_your_writes_window must not be negative"
+            raise ValueError(msg)
+        return v
+
+    @property
+    def workers_per_host(self) -> int:
+        """Number of workers sharing this host's connection budget."""
+        if self.db_workers_per_host:
+            return self.db_workers_per_host
+        web_concurrency = os.environ.get("WEB_CONCURRENCY", "")
+        if web_concurrency.isdigit() and int(web_concurrency) > 0:
+            return int(web_concurrency)
+        return os.cpu_count() or 1
+
+    def pool_limits(self) -> tuple[int, int]:
+        """Pool size and max overflow for one worker.
+
+        Returns:
+            Tuple of (pool_size, max_overflow). In auto mode a quarter of the
+            worker's share is kept open and the rest is overflow, matching the
+            fixed-mode ratio.
+        """
+        if self.db_pool_mode == "fixed":
+            return self.db_pool_size, self.db_max_overflow
+
+        per_worker = max(1, self.db_host_connection_budget // self.workers_per_host)
+        pool_size = max(1, per_worker // 4)
+        return pool_size, per_worker - pool_size
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+
+
 class Settings(BaseSettings):
     """Application settings.
 
@@ -82,6 +186,9 @@ class Settings(BaseSettings):
     # Bedrock (nested, all optional)
     bedrock: BedrockSettings = None  # type: ignore[assignment]
 
+    # Database pool (nested, all optional)
+    database: DatabaseSettings = None  # type: ignore[assignment]
+
     # Application settings (optional)
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     max_tool_calls: int = 20
@@ -94,6 +201,8 @@ class Settings(BaseSettings):
             data["cognito"] = CognitoSettings()
         if "bedrock" not in data or data["bedrock"] is None:
             data["bedrock"] = BedrockSettings()
+        if "database" not in data or data["database"] is None:
+            data["database"] = DatabaseSettings()
         super().__init__(**data)
 
     @field_validator("max_tool_calls")
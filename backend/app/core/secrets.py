@@ -9,10 +9,22 @@ Usage:
 
     # Or with fallback to environment variable:
     secret = manager.get_secret_or_env("arn:...", "DATABASE_URL")
+
+    # From async code, with caching and parallel prefetch at startup:
+    async_manager = AsyncSecretsManager(ttl=300)
+    await async_manager.prefetch(["arn:...db", "arn:...api"])
+    secret = await async_manager.get_secret("arn:...db")
+
+    # Poll for rotated versions in the background:
+    async_manager.add_rotation_listener(on_rotate)
+    await async_manager.start(["arn:...db"], interval=300)
 """
 
+import asyncio
+import contextlib
 import os
 import time
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -36,6 +48,22 @@ class SecretsManagerError(Exception):
     pass
 
 
+def _secret_value(response: dict[str, Any], secret_arn: str) -> str:
+    """Extract the secret value from a GetSecretValue response.
+
+    Raises:
+        SecretsManagerError: The secret has no value.
+    """
+    # Handle string or binary secret
+    if "SecretString" in response:
+        return response["SecretString"]
+    if "SecretBinary" in response:
+        return response["SecretBinary"].decode("utf-8")
+
+    msg = f"Secret {secret_arn} has no value"
+    raise SecretsManagerError(msg)
+
+
 class SecretsManager:
     """Client wrapper for AWS Secrets Manager with retry logic."""
 
@@ -74,15 +102,7 @@ class SecretsManager:
         for attempt in range(self._max_retries + 1):
             try:
                 response = client.get_secret_value(SecretId=secret_arn)
-
-                # Handle string or binary secret
-                if "SecretString" in response:
-                    return response["SecretString"]
-                if "SecretBinary" in response:
-                    return response["SecretBinary"].decode("utf-8")
-
-                msg = f"Secret {secret_arn} has no value"
-                raise SecretsManagerError(msg)
+                return _secret_value(response, secret_arn)
 
             except SecretsManagerError:
                 raise
@@ -130,3 +150,223 @@ class SecretsManager:
 
             msg = f"Failed to fetch secret and no fallback env var {env_var}"
             raise SecretsManagerError(msg) from None
+
+
+class AsyncSecretsManager:
+    """Async Secrets Manager client with a TTL cache and parallel prefetch.
+
+    boto3 calls run in worker threads and retries back off with asyncio.sleep,
+    so the event loop is never blocked. Concurrent lookups of the same secret
+    share one request. start() polls watched secrets and notifies rotation
+    listeners when a new version appears.
+    """
+
+    def __init__(self, max_retries: int = 1, retry_delay: float = 0.5, ttl: float = 300.0) -> None:
+        """Initialize the async Secrets Manager client.
+
+        Args:
+            max_retries: Maximum number of retry attempts (default: 1).
+            retry_delay: Delay between retries in seconds (default: 0.5).
+            ttl: Seconds a fetched secret is served from cache (default: 5 minutes).
+        """
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._ttl = ttl
+        self._client = None
+        self._client_lock = asyncio.Lock()
+        self._cache: dict[str, tuple[str, float]] = {}
+        self._in_flight: dict[str, asyncio.Task[str]] = {}
+        self._versions: dict[str, str] = {}
+        self._rotation_listeners: list[Callable[[str, str], None]] = []
+        self._watch_task: asyncio.Task[None] | None = None
+
+    async def _get_client(self) -> Any:
+        """Lazily initialize boto3 client in a worker thread.
+
+        Importing boto3 and building a client takes around a hundred
+        milliseconds, too long to run on the event loop. Concurrent first
+        callers wait for the same client.
+        """
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    self._client = await asyncio.to_thread(_create_secrets_client)
+        return self._client
+
+    async def get_secret(self, secret_arn: str) -> str:
+        """Fetch a secret value, serving it from cache while fresh.
+
+        Args:
+            secret_arn: ARN or name of the secret.
+
+        Returns:
+            The secret value as a string.
+
+        Raises:
+            SecretsManagerError: If the secret cannot be fetched after retries.
+        """
+        cached = self._cache.get(secret_arn)
+        if cached is not None and time.monotonic() - cached[1] < self._ttl:
+            return cached[0]
+
+        return await self._fetch_shared(secret_arn)
+
+    async def get_secret_or_env(self, secret_arn: str, env_var: str) -> str:
+        """Fetch a secret, falling back to environment variable.
+
+        Args:
+            secret_arn: ARN or name of the secret.
+            env_var: Environment variable name for fallback.
+
+        Returns:
+            The secret value (from Secrets Manager or env var).
+
+        Raises:
+            SecretsManagerError: If both sources fail.
+        """
+        try:
+            return await self.get_secret(secret_arn)
+        except SecretsManagerError:
+            logger.info(
+                "secrets_manager_fallback",
+                secret_arn=secret_arn,
+                env_var=env_var,
+            )
+
+            value = os.environ.get(env_var)
+            if value is not None:
+                return value
+
+            msg = f"Failed to fetch secret and no fallback env var {env_var}"
+            raise SecretsManagerError(msg) from None
+
+    async def prefetch(self, secret_arns: Iterable[str]) -> dict[str, str]:
+        """Fetch several secrets in parallel and cache them.
+
+        Args:
+            secret_arns: ARNs or names of the secrets.
+
+        Returns:
+            Mapping of ARN to secret value.
+
+        Raises:
+            SecretsManagerError: If any secret cannot be fetched.
+        """
+        arns = list(dict.fromkeys(secret_arns))
+        values = await asyncio.gather(*(self.get_secret(arn) for arn in arns))
+        return dict(zip(arns, values, strict=True))
+
+    async def start(self, secret_arns: Iterable[str], interval: float = 300.0) -> None:
+        """Load secrets and poll them in the background for new versions.
+
+        Rotation listeners are called whenever a poll returns a version other
+        than the one last seen. Call close() to stop polling.
+
+        Args:
+            secret_arns: ARNs or names of the secrets to watch.
+            interval: Seconds between polls (default: 5 minutes).
+
+        Raises:
+            SecretsManagerError: If the initial fetch fails.
+        """
+        if self._watch_task is not None:
+            return
+
+        arns = list(dict.fromkeys(secret_arns))
+        await self.prefetch(arns)
+        self._watch_task = asyncio.create_task(self._watch(arns, interval))
+
+    def add_rotation_listener(self, listener: Callable[[str, str], None]) -> None:
+        """Register a callback invoked when a secret rotates.
+
+        Args:
+            listener: Callable taking the secret ARN and its new value.
+        """
+        self._rotation_listeners.append(listener)
+
+    async def close(self) -> None:
+        """Stop background polling."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._watch_task
+            self._watch_task = None
+
+    def invalidate(self, secret_arn: str | None = None) -> None:
+        """Drop one cached secret, or all of them.
+
+        Args:
+            secret_arn: Secret to drop; None clears the whole cache.
+        """
+        if secret_arn is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(secret_arn, None)
+
+    async def _fetch_shared(self, secret_arn: str) -> str:
+        """Fetch a secret, joining a request already in flight for it."""
+        task = self._in_flight.get(secret_arn)
+        if task is None:
+            task = asyncio.create_task(self._fetch(secret_arn))
+            self._in_flight[secret_arn] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(secret_arn, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch(self, secret_arn: str) -> str:
+        """Fetch a secret with non-blocking retries and cache it."""
+        client = await self._get_client()
+        last_error = None
+
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = await asyncio.to_thread(client.get_secret_value, SecretId=secret_arn)
+                value = _secret_value(response, secret_arn)
+                self._cache[secret_arn] = (value, time.monotonic())
+                self._record_version(secret_arn, response.get("VersionId"), value)
+                return value
+
+            except SecretsManagerError:
+                raise
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    "secrets_manager_error",
+                    secret_arn=secret_arn,
+                    attempt=attempt + 1,
+                    max_retries=self._max_retries,
+                    error=str(e),
+                )
+
+                if attempt < self._max_retries:
+                    await asyncio.sleep(self._retry_delay)
+
+        msg = f"Failed to fetch secret {secret_arn} after {self._max_retries + 1} attempts: {last_error}"
+        raise SecretsManagerError(msg)
+
+    async def _watch(self, secret_arns: list[str], interval: float) -> None:
+        """Re-fetch watched secrets every interval, bypassing the cache."""
+        while True:
+            await asyncio.sleep(interval)
+            results = await asyncio.gather(*(self._fetch_shared(arn) for arn in secret_arns), return_exceptions=True)
+            for secret_arn, result in zip(secret_arns, results, strict=True):
+                if isinstance(result, SecretsManagerError):
+                    # The cached value stays in place; the next poll retries
+                    logger.warning("secrets_manager_poll_failed", secret_arn=secret_arn, error=str(result))
+
+    def _record_version(self, secret_arn: str, version_id: str | None, value: str) -> None:
+        """Track the fetched version and notify listeners if it changed."""
+        if version_id is None:
+            return
+
+        previous = self._versions.get(secret_arn)
+        self._versions[secret_arn] = version_id
+        if previous is None or previous == version_id:
+            return
+
+        logger.info("secret_rotated", secret_arn=secret_arn, version_id=version_id)
+        for listener in self._rotation_listeners:
+            try:
+                listener(secret_arn, value)
+            except Exception as e:
+                logger.warning("secret_rotation_listener_failed", secret_arn=secret_arn, error=str(e))
@@ -1,17 +1,49 @@
 """Faceplate database configuration and session management."""
 
+from typing import Any
+
+from app.db import session as _session
+from app.db.pool_metrics import set_current_endpoint
 from app.db.session import (
     DatabaseConnectionError,
-    async_session_factory,
-    engine,
+    InvalidCursorError,
+    LastWrite,
+    dispose_engine,
+    enable_credential_rotation,
     get_db,
+    get_engine,
+    get_pool_metrics,
+    get_read_db,
+    get_replica_engine,
+    get_replica_session_factory,
     get_session,
+    get_session_factory,
+    run_in_transaction,
+    set_database_credentials,
+    set_last_write,
 )
 
 __all__ = [
     "DatabaseConnectionError",
-    "async_session_factory",
-    "engine",
+    "InvalidCursorError",
+    "LastWrite",
+    "dispose_engine",
+    "enable_credential_rotation",
     "get_db",
+    "get_engine",
+    "get_pool_metrics",
+    "get_read_db",
+    "get_replica_engine",
+    "get_replica_session_factory",
     "get_session",
+    "get_session_factory",
+    "run_in_transaction",
+    "set_current_endpoint",
+    "set_database_credentials",
+    "set_last_write",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``engine`` and ``async_session_factory`` lazily."""
+    return getattr(_session, name)
@@ -0,0 +1,152 @@
+"""Keyset-paginated listing of a user's conversations.
+
+Pages are ordered most recently updated first, by (updated_at, created_at, id),
+and read through the ix_conversations_user_id_updated_at index. The query
+selects only the columns a list needs, including the denormalized message
+summary, so each page is one index range scan of conversations however many
+conversations or messages the user has.
+
+Usage:
+    page = await list_conversations(session, user_id, limit=100)
+    older = await list_conversations(session, user_id, before=page.cursor)
+"""
+
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import InvalidCursorError
+from app.models.conversation import Conversation
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class ConversationCursor:
+    """Position of a conversation in list order."""
+
+    updated_at: datetime
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe string for API responses."""
+        raw = f"{self.updated_at.isoformat()}|{self.created_at.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "ConversationCursor":
+        """Decode a string produced by encode().
+
+        Raises:
+            InvalidCursorError: The value is not a valid cursor.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+            updated_at, created_at, conversation_id = raw.split("|")
+            return cls(
+                updated_at=datetime.fromisoformat(updated_at),
+                created_at=datetime.fromisoformat(created_at),
+                id=UUID(conversation_id),
+            )
+        except ValueError as e:
+            msg = f"Invalid conversation cursor: {value!r}"
+            raise InvalidCursorError(msg) from e
+
+
+@dataclass(frozen=True)
+class ConversationSummary:
+    """The columns of a conversation shown in a list."""
+
+    id: UUID
+    title: str
+    updated_at: datetime
+    message_count: int
+    last_message_at: datetime | None
+    last_message_preview: str | None
+
+
+@dataclass
+class ConversationPage:
+    """One page of conversations, most recently updated first."""
+
+    conversations: list[ConversationSummary]
+    has_more: bool
+    cursor: ConversationCursor | None  # Next (older) page, None if no more
+
+
+async def list_conversations(
+    session: AsyncSession,
+    user_id: UUID,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    before: ConversationCursor | None = None,
+) -> ConversationPage:
+    """Load one page of a user's conversations.
+
+    Args:
+        session: Database session.
+        user_id: Owner of the conversations.
+        limit: Page size, capped at MAX_PAGE_SIZE.
+        before: Return conversations after this cursor in list order, i.e.
+            updated less recently.
+
+    Returns:
+        The page, with a cursor for the next one.
+
+    Raises:
+        ValueError: limit is not positive.
+    """
+    if limit <= 0:
+        msg = "limit must be positive"
+        raise ValueError(msg)
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    # created_at is not returned but comes from the index for the cursor
+    stmt = (
+        select(
+            Conversation.id,
+            Conversation.title,
+            Conversation.updated_at,
+            Conversation.created_at,
+            Conversation.message_count,
+            Conversation.last_message_at,
+            Conversation.last_message_preview,
+        )
+        .where(Conversation.user_id == user_id)
+        .order_by(Conversation.updated_at.desc(), Conversation.created_at.desc(), Conversation.id.desc())
+        .limit(limit + 1)
+    )
+    if before is not None:
+        key = tuple_(Conversation.updated_at, Conversation.created_at, Conversation.id)
+        stmt = stmt.where(key < tuple_(before.updated_at, before.created_at, before.id))
+
+    # Fetch one extra row to learn whether another page exists
+    rows = list(await session.execute(stmt))
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    cursor = None
+    if has_more:
+        last = rows[-1]
+        cursor = ConversationCursor(updated_at=last.updated_at, created_at=last.created_at, id=last.id)
+    return ConversationPage(
+        conversations=[
+            ConversationSummary(
+                id=row.id,
+                title=row.title,
+                updated_at=row.updated_at,
+                message_count=row.message_count,
+                last_message_at=row.last_message_at,
+                last_message_preview=row.last_message_preview,
+            )
+            for row in rows
+        ],
+        has_more=has_more,
+        cursor=cursor,
+    )
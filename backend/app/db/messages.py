@@ -0,0 +1,291 @@
+"""Keyset-paginated access to conversation message history.
+
+Message ids are uuid7, generated by the application at insert, so id order is
+creation order: each process issues strictly increasing ids, and ids from
+different processes within the same millisecond tie-break on their random
+bits. Pages are therefore ordered and keyed by id alone and read through the
+ix_messages_conversation_id_id index, so every page costs the same no matter
+how long the conversation is. Messages must not be inserted with ids from
+another source.
+
+Usage:
+    # Most recent messages, for opening a conversation
+    page = await get_message_page(session, conversation_id, limit=50)
+
+    # Scroll back
+    older = await get_message_page(session, conversation_id, before=page.cursor)
+
+    # Walk the whole history in bounded pages, e.g. to build LLM context
+    async for message in iter_messages(session, conversation_id):
+        ...
+
+    # Store a message, keeping the conversation's summary columns current
+    await add_message(session, Message(conversation_id=conversation_id, role="assistant", content=text))
+"""
+
+import base64
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import InvalidCursorError
+from app.models.conversation import LAST_MESSAGE_PREVIEW_LENGTH, Conversation
+from app.models.message import Message
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Seconds within which further messages in a turn leave updated_at alone
+UPDATED_AT_DEBOUNCE = 5.0
+
+
+@dataclass(frozen=True)
+class MessageCursor:
+    """Position of a message in history order."""
+
+    id: UUID
+
+    @classmethod
+    def of(cls, message: Message) -> "MessageCursor":
+        """Cursor pointing at a message."""
+        return cls(id=message.id)
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe string for API responses."""
+        return base64.urlsafe_b64encode(self.id.bytes).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, value: str) -> "MessageCursor":
+        """Decode a string produced by encode().
+
+        Raises:
+            InvalidCursorError: The value is not a valid cursor.
+        """
+        try:
+            return cls(id=UUID(bytes=base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))))
+        except ValueError as e:
+            msg = f"Invalid message cursor: {value!r}"
+            raise InvalidCursorError(msg) from e
+
+
+@dataclass
+class MessagePage:
+    """One page of messages, oldest first."""
+
+    messages: list[Message]
+    has_more: bool
+    cursor: MessageCursor | None  # Continue in the same direction, None if no more
+
+
+async def get_message_page(
+    session: AsyncSession,
+    conversation_id: UUID,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    before: MessageCursor | None = None,
+    after: MessageCursor | None = None,
+) -> MessagePage:
+    """Load one page of a conversation's messages.
+
+    Without a cursor, returns the most recent messages. With ``before``,
+    returns the messages preceding it (scrolling back); with ``after``, the
+    messages following it (reading forward). Either way the page is sorted
+    oldest first.
+
+    Args:
+        session: Database session.
+        conversation_id: Conversation to read.
+        limit: Page size, capped at MAX_PAGE_SIZE.
+        before: Return messages older than this cursor.
+        after: Return messages newer than this cursor.
+
+    Returns:
+        The page, with a cursor for the next page in the same direction.
+
+    Raises:
+        ValueError: Both before and after were given, or limit is not positive.
+    """
+    if before is not None and after is not None:
+        msg = "Pass at most one of before and after"
+        raise ValueError(msg)
+    if limit <= 0:
+        msg = "limit must be positive"
+        raise ValueError(msg)
+    limit = min(limit, MAX_PAGE_SIZE)
+
+    stmt = select(Message).where(Message.conversation_id == conversation_id)
+    if after is not None:
+        stmt = stmt.where(Message.id > after.id).order_by(Message.id)
+    else:
+        if before is not None:
+            stmt = stmt.where(Message.id < before.id)
+        stmt = stmt.order_by(Message.id.desc())
+
+    # Fetch one extra row to learn whether another page exists
+    result = await session.execute(stmt.limit(limit + 1))
+    messages = list(result.scalars())
+    has_more = len(messages) > limit
+    messages = messages[:limit]
+
+    if after is None:
+        messages.reverse()
+        edge = messages[0] if messages else None
+    else:
+        edge = messages[-1] if messages else None
+
+    cursor = MessageCursor.of(edge) if has_more and edge is not None else None
+    return MessagePage(messages=messages, has_more=has_more, cursor=cursor)
+
+
+async def iter_messages(
+    session: AsyncSession,
+    conversation_id: UUID,
+    *,
+    page_size: int = MAX_PAGE_SIZE,
+) -> AsyncIterator[Message]:
+    """Yield all of a conversation's messages, oldest first, one page at a time.
+
+    Args:
+        session: Database session.
+        conversation_id: Conversation to read.
+        page_size: Messages fetched per query.
+    """
+    stmt = select(Message).where(Message.conversation_id == conversation_id).order_by(Message.id).limit(page_size)
+    page_stmt = stmt
+    while True:
+        result = await session.execute(page_stmt)
+        messages = list(result.scalars())
+        for message in messages:
+            yield message
+        if len(messages) < page_size:
+            return
+        page_stmt = stmt.where(Message.id > messages[-1].id)
+
+
+async def touch_conversation(
+    session: AsyncSession,
+    conversation_id: UUID,
+    *,
+    debounce: float = UPDATED_AT_DEBOUNCE,
+) -> bool:
+    """Set a conversation's updated_at to now, unless it was set recently.
+
+    The check is part of the UPDATE's WHERE clause, so a debounced call
+    matches no row and writes nothing.
+
+    Args:
+        session: Database session.
+        conversation_id: Conversation to bump.
+        debounce: Skip the bump if updated_at is less than this many seconds
+            old. Zero always bumps.
+
+    Returns:
+        True if updated_at was changed.
+    """
+    stmt = update(Conversation).where(Conversation.id == conversation_id)
+    if debounce > 0:
+        stmt = stmt.where(Conversation.updated_at < func.now() - timedelta(seconds=debounce))
+    stmt = stmt.values(updated_at=func.now()).execution_options(synchronize_session=False)
+    result = await session.execute(stmt)
+    return result.rowcount > 0
+
+
+def _preview(content: str | None) -> str | None:
+    """Collapse whitespace and truncate content for last_message_preview."""
+    if content is None:
+        return None
+    return " ".join(content.split())[:LAST_MESSAGE_PREVIEW_LENGTH]
+
+
+async def add_message(
+    session: AsyncSession,
+    message: Message,
+    *,
+    debounce: float = UPDATED_AT_DEBOUNCE,
+) -> Message:
+    """Store a message and update its conversation's summary columns.
+
+    message_count, last_message_at and last_message_preview change with every
+    message. A message without content (e.g. a bare tool call) keeps the
+    previous preview.
+
+    updated_at is debounced: a user message starts a turn and always bumps
+    it, while the assistant and tool messages streamed in reply bump it at
+    most once per ``debounce`` seconds. Otherwise it is written back
+    unchanged, and since the summary columns are not indexed the UPDATE is
+    HOT.
+
+    Args:
+        session: Database session. The caller commits.
+        message: Message to insert.
+        debounce: Window for non-user messages, see touch_conversation().
+
+    Returns:
+        The flushed message.
+    """
+    session.add(message)
+    await session.flush()
+
+    if message.role == "user" or debounce <= 0:
+        updated_at = func.now()
+    else:
+        updated_at = case(
+            (Conversation.updated_at < func.now() - timedelta(seconds=debounce), func.now()),
+            else_=Conversation.updated_at,
+        )
+    values = {
+        "message_count": Conversation.message_count + 1,
+        # Read in SQL: created_at may be a server default not loaded on the object
+        "last_message_at": select(Message.created_at).where(Message.id == message.id).scalar_subquery(),
+        "updated_at": updated_at,
+    }
+    preview = _preview(message.content)
+    if preview is not None:
+        values["last_message_preview"] = preview
+
+    await session.execute(
+        update(Conversation)
+        .where(Conversation.id == message.conversation_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+    return message
+
+
+async def delete_message(session: AsyncSession, message: Message) -> None:
+    """Delete a message and update its conversation's summary columns.
+
+    last_message_at and last_message_preview are recomputed from the newest
+    remaining messages. updated_at is left alone.
+
+    Args:
+        session: Database session. The caller commits.
+        message: Message to delete.
+    """
+    conversation_id = message.conversation_id
+    await session.delete(message)
+    await session.flush()
+
+    newest = (
+        select(Message.created_at, Message.content)
+        .where(Message.conversation_id == conversation_id)
+        .order_by(Message.id.desc())
+    )
+    last = (await session.execute(newest.limit(1))).first()
+    with_content = (await session.execute(newest.where(Message.content.is_not(None)).limit(1))).first()
+
+    await session.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(
+            message_count=Conversation.message_count - 1,
+            last_message_at=last.created_at if last else None,
+            last_message_preview=_preview(with_content.content) if with_content else None,
+            updated_at=Conversation.updated_at,  # Not a bump; overrides onupdate
+        )
+        .execution_options(synchronize_session=False)
+    )
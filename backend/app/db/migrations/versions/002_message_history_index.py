@@ -0,0 +1,64 @@
+"""Composite index for keyset-paginated message history.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index messages by (conversation_id, created_at, id).
+
+    The composite index also serves conversation_id lookups and cascade
+    deletes, so the single-column index is dropped. Built concurrently to
+    avoid blocking message writes on a large table.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_messages_conversation_id_created_at_id",
+            "messages",
+            ["conversation_id", "created_at", "id"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_conversation_id",
+            table_name="messages",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column conversation_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_messages_conversation_id",
+            "messages",
+            ["conversation_id"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_conversation_id_created_at_id",
+            table_name="messages",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,68 @@
+"""Index for keyset-paginated conversation lists.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index conversations by (user_id, updated_at, created_at, id), newest first.
+
+    Each list page is one range scan of this index in keyset order, reading
+    the remaining columns from the rows it finds. title is carried with
+    INCLUDE but does not make the scan index-only. The composite index also
+    serves user_id lookups and cascade deletes, so the single-column index is
+    dropped. Built concurrently to avoid blocking writes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_conversations_user_id_updated_at",
+            "conversations",
+            ["user_id", sa.text("updated_at DESC"), sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            schema="faceplate",
+            postgresql_include=["title"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_conversations_user_id",
+            table_name="conversations",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the single-column user_id index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_conversations_user_id",
+            "conversations",
+            ["user_id"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_conversations_user_id_updated_at",
+            table_name="conversations",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
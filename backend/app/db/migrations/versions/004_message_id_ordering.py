@@ -0,0 +1,81 @@
+"""Order message history by uuid7 id.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the created_at indexes on messages with (conversation_id, id).
+
+    Message ids are time-ordered uuid7, so history is paged by id alone. That
+    leaves the global created_at index and the created_at column in the
+    history index without a reader. Built and dropped concurrently to avoid
+    blocking message writes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_messages_conversation_id_id",
+            "messages",
+            ["conversation_id", "id"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_conversation_id_created_at_id",
+            table_name="messages",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_created_at",
+            table_name="messages",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the created_at indexes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_messages_created_at",
+            "messages",
+            ["created_at"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_messages_conversation_id_created_at_id",
+            "messages",
+            ["conversation_id", "created_at", "id"],
+            unique=False,
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_messages_conversation_id_id",
+            table_name="messages",
+            schema="faceplate",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
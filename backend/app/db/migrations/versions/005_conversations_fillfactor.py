@@ -0,0 +1,33 @@
+"""Lower the conversations fillfactor for HOT updates.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Set fillfactor = 80 on conversations.
+
+    Conversation rows are updated far more often than inserted. Free space on
+    each page lets an update that changes no indexed column stay on the same
+    page as a HOT update. Only pages written from now on are affected; a table
+    rewrite (e.g. pg_repack) applies it to existing pages.
+    """
+    op.execute("ALTER TABLE faceplate.conversations SET (fillfactor = 80)")
+
+
+def downgrade() -> None:
+    """Restore the default fillfactor."""
+    op.execute("ALTER TABLE faceplate.conversations RESET (fillfactor)")
@@ -0,0 +1,101 @@
+"""Denormalized message summary columns on conversations.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Must match LAST_MESSAGE_PREVIEW_LENGTH and app.db.messages._preview() at the
+# time of writing; migrations do not import application code.
+PREVIEW_LENGTH = 120
+
+BACKFILL_BATCH = sa.text(
+    """
+    WITH batch AS (
+        SELECT id FROM faceplate.conversations
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+    )
+    UPDATE faceplate.conversations AS c
+    SET message_count = (
+            SELECT count(*) FROM faceplate.messages AS m WHERE m.conversation_id = c.id
+        ),
+        last_message_at = (
+            SELECT m.created_at FROM faceplate.messages AS m
+            WHERE m.conversation_id = c.id
+            ORDER BY m.id DESC LIMIT 1
+        ),
+        last_message_preview = (
+            SELECT left(btrim(regexp_replace(m.content, '\\s+', ' ', 'g')), :preview_length)
+            FROM faceplate.messages AS m
+            WHERE m.conversation_id = c.id AND m.content IS NOT NULL
+            ORDER BY m.id DESC LIMIT 1
+        )
+    FROM batch
+    WHERE c.id = batch.id
+    RETURNING c.id
+    """
+)
+
+
+def upgrade() -> None:
+    """Add message_count, last_message_at and last_message_preview, then backfill.
+
+    The columns are added with constant defaults, which does not rewrite the
+    table. The backfill runs in committed batches of conversations, each
+    reading that batch's messages through the (conversation_id, id) index, so
+    no long transaction holds row locks. The columns exist once the
+    additions commit, so code that maintains them can be rolled out while the
+    backfill runs; messages stored by older code after their conversation's
+    batch was backfilled are not counted.
+    """
+    op.add_column(
+        "conversations",
+        sa.Column("message_count", sa.Integer(), server_default="0", nullable=False),
+        schema="faceplate",
+    )
+    op.add_column(
+        "conversations",
+        sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True),
+        schema="faceplate",
+    )
+    op.add_column(
+        "conversations",
+        sa.Column("last_message_preview", sa.String(length=PREVIEW_LENGTH), nullable=True),
+        schema="faceplate",
+    )
+
+    connection = op.get_bind()
+    with op.get_context().autocommit_block():
+        after = "00000000-0000-0000-0000-000000000000"
+        while True:
+            ids = connection.execute(
+                BACKFILL_BATCH,
+                {"after": after, "batch_size": BACKFILL_BATCH_SIZE, "preview_length": PREVIEW_LENGTH},
+            ).scalars()
+            batch_max = max(ids, default=None)
+            if batch_max is None:
+                break
+            after = batch_max
+
+
+def downgrade() -> None:
+    """Drop the summary columns."""
+    op.drop_column("conversations", "last_message_preview", schema="faceplate")
+    op.drop_column("conversations", "last_message_at", schema="faceplate")
+    op.drop_column("conversations", "message_count", schema="faceplate")
@@ -0,0 +1,153 @@
+"""Partition messages by month on the uuid7 id.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Monthly partitions created after the legacy one; the application's
+# maintenance task keeps DB_PARTITIONS_AHEAD months ready from then on.
+PARTITIONS_AHEAD = 3
+
+
+# Mirrors app.models.message at the time of writing; migrations do not import
+# application code.
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> UUID:
+    milliseconds = int(datetime(month.year, month.month, 1, tzinfo=UTC).timestamp() * 1000)
+    return UUID(int=milliseconds << 80)
+
+
+def upgrade() -> None:
+    """Turn messages into a table range-partitioned on id, one partition per month.
+
+    Existing rows are not copied. The current table becomes the first
+    partition, messages_legacy, covering every id before the start of the
+    month after next; that leaves at least a month for the migration to run
+    before new ids outgrow it. A CHECK constraint matching that range is
+    validated first without blocking writes, so attaching skips the scan and
+    the swap itself only takes brief locks. Retention drops messages_legacy
+    once its whole range has expired.
+    """
+    legacy_end = _add_months(datetime.now(UTC).date().replace(day=1), 2)
+    legacy_upper = _bound(legacy_end)
+
+    op.execute(
+        f"ALTER TABLE faceplate.messages ADD CONSTRAINT ck_messages_legacy_range CHECK (id < '{legacy_upper}') NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE faceplate.messages VALIDATE CONSTRAINT ck_messages_legacy_range")
+
+    op.rename_table("messages", "messages_legacy", schema="faceplate")
+    op.execute("ALTER TABLE faceplate.messages_legacy RENAME CONSTRAINT pk_messages TO pk_messages_legacy")
+    op.execute(
+        "ALTER INDEX faceplate.ix_messages_conversation_id_id RENAME TO ix_messages_legacy_conversation_id_id"
+    )
+
+    op.create_table(
+        "messages",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("conversation_id", sa.UUID(), nullable=False),
+        sa.Column("role", sa.String(length=20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("tool_calls", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("tool_results", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"],
+            ["faceplate.conversations.id"],
+            name=op.f("fk_messages_conversation_id_conversations"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_messages")),
+        schema="faceplate",
+        postgresql_partition_by="RANGE (id)",
+    )
+    op.create_index(
+        "ix_messages_conversation_id_id",
+        "messages",
+        ["conversation_id", "id"],
+        unique=False,
+        schema="faceplate",
+    )
+
+    op.execute(
+        "ALTER TABLE faceplate.messages ATTACH PARTITION faceplate.messages_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{legacy_upper}')"
+    )
+    op.execute("ALTER TABLE faceplate.messages_legacy DROP CONSTRAINT ck_messages_legacy_range")
+
+    for months in range(PARTITIONS_AHEAD):
+        month = _add_months(legacy_end, months)
+        op.execute(
+            f"CREATE TABLE faceplate.messages_p{month:%Y_%m} PARTITION OF faceplate.messages "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(_add_months(month, 1))}')"
+        )
+
+
+def downgrade() -> None:
+    """Copy messages back into an unpartitioned table.
+
+    This rewrites every message and holds locks for the duration; it is meant
+    for rolling back soon after upgrading, not for a table that has grown.
+    """
+    op.execute("ALTER TABLE faceplate.messages RENAME TO messages_partitioned")
+    op.execute("ALTER TABLE faceplate.messages_partitioned RENAME CONSTRAINT pk_messages TO pk_messages_partitioned")
+    op.execute("ALTER INDEX faceplate.ix_messages_conversation_id_id RENAME TO ix_messages_partitioned_conversation_id_id")
+
+    op.create_table(
+        "messages",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("conversation_id", sa.UUID(), nullable=False),
+        sa.Column("role", sa.String(length=20), nullable=False),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("tool_calls", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("tool_results", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"],
+            ["faceplate.conversations.id"],
+            name=op.f("fk_messages_conversation_id_conversations"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_messages")),
+        schema="faceplate",
+    )
+    op.execute("INSERT INTO faceplate.messages SELECT * FROM faceplate.messages_partitioned")
+    op.drop_table("messages_partitioned", schema="faceplate")
+    op.create_index(
+        "ix_messages_conversation_id_id",
+        "messages",
+        ["conversation_id", "id"],
+        unique=False,
+        schema="faceplate",
+    )
@@ -0,0 +1,295 @@
+"""Monthly partitions of the messages table.
+
+faceplate.messages is range-partitioned on its uuid7 id, one partition per
+month (see app.models.message.message_partition_bounds). Partitions must exist
+before messages for their month arrive, and old ones are dropped whole for
+retention instead of deleting messages row by row.
+
+Usage:
+    # On app startup: keep DB_PARTITIONS_AHEAD months of partitions ready and,
+    # if DB_MESSAGE_RETENTION_MONTHS is set, drop expired ones
+    start_partition_maintenance()
+
+    # On shutdown
+    await stop_partition_maintenance()
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.core.config import get_settings
+from app.db.session import get_engine, run_in_transaction
+from app.models.message import add_months, message_partition_bounds, message_partition_ddl, message_partition_name
+
+logger = logging.getLogger(__name__)
+
+# Lets one worker per cluster run maintenance at a time
+_MAINTENANCE_LOCK_KEY = 0x6D657373  # "mess"
+
+# Give up rather than queue behind long queries while holding up others
+_LOCK_TIMEOUT = "5s"
+
+_PARTITIONS = text(
+    """
+    SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+    FROM pg_inherits AS i
+    JOIN pg_class AS c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'faceplate.messages'::regclass
+    """
+)
+
+# Partitions whose DETACH ... CONCURRENTLY was interrupted
+_DETACH_PENDING = text(
+    """
+    SELECT c.relname
+    FROM pg_inherits AS i
+    JOIN pg_class AS c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'faceplate.messages'::regclass AND i.inhdetachpending
+    """
+)
+
+_ATTACHED = text(
+    """
+    SELECT c.relname
+    FROM pg_inherits AS i
+    JOIN pg_class AS c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'faceplate.messages'::regclass
+    """
+)
+
+# Former partitions detached but not yet dropped
+_DETACHED = text(
+    """
+    SELECT c.relname
+    FROM pg_class AS c
+    JOIN pg_namespace AS n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'faceplate' AND c.relkind = 'r' AND NOT c.relispartition
+      AND c.relname ~ '^messages_(legacy|p[0-9]{4}_[0-9]{2})$'
+    """
+)
+
+_MONTHLY_NAME = re.compile(r"messages_p(\d{4})_(\d{2})")
+
+_RANGE = re.compile(r"FROM \((?:MINVALUE|'([0-9a-f-]{36})')\) TO \((?:MAXVALUE|'([0-9a-f-]{36})')\)")
+
+_maintenance_task: asyncio.Task[None] | None = None
+
+
+def _current_month(today: date | None) -> date:
+    return (today or datetime.now(UTC).date()).replace(day=1)
+
+
+async def _partition_ranges(
+    session: AsyncSession | AsyncConnection,
+) -> dict[str, tuple[UUID | None, UUID | None]]:
+    """Map each messages partition to its id range [lower, upper), None where unbounded."""
+    ranges: dict[str, tuple[UUID | None, UUID | None]] = {}
+    for row in await session.execute(_PARTITIONS):
+        match = _RANGE.search(row.bound)
+        if match is None:  # DEFAULT partition
+            continue
+        lower, upper = match.groups()
+        ranges[row.name] = (UUID(lower) if lower else None, UUID(upper) if upper else None)
+    return ranges
+
+
+async def ensure_message_partitions(
+    session: AsyncSession,
+    *,
+    months_ahead: int = 3,
+    today: date | None = None,
+) -> list[str]:
+    """Create any missing partitions from the current month to ``months_ahead`` on.
+
+    Args:
+        session: Database session. The caller commits.
+        months_ahead: Months of partitions to keep ready beyond the current one.
+        today: Date to treat as today (default: now, UTC).
+
+    Returns:
+        Names of the partitions created.
+    """
+    await session.execute(text(f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"))
+    ranges = list((await _partition_ranges(session)).values())
+    current = _current_month(today)
+
+    created = []
+    for months in range(months_ahead + 1):
+        month = add_months(current, months)
+        start, _ = message_partition_bounds(month)
+        # Months covered by a wider partition, such as messages_legacy, are skipped
+        if any((lower is None or lower <= start) and (upper is None or start < upper) for lower, upper in ranges):
+            continue
+        await session.execute(text(message_partition_ddl(month)))
+        created.append(message_partition_name(month))
+    return created
+
+
+async def drop_expired_message_partitions(
+    engine: AsyncEngine,
+    *,
+    retain_months: int,
+    today: date | None = None,
+) -> list[str]:
+    """Detach and drop partitions that hold only messages older than the retention period.
+
+    A partition is dropped once its whole range precedes the start of the
+    month ``retain_months`` before the current one, so between
+    ``retain_months`` and ``retain_months + 1`` months of messages are kept.
+
+    Partitions are detached with DETACH PARTITION CONCURRENTLY, which does not
+    block reads or writes of faceplate.messages as dropping an attached
+    partition would. Each detached table is then dropped in a transaction
+    that first subtracts its rows from the conversations' summary columns.
+    Detaches and drops left unfinished by an interrupted round are completed.
+
+    Args:
+        engine: Engine to connect with. Detaching concurrently cannot run in
+            a transaction, so this opens its own connections.
+        retain_months: Whole months of messages to keep before the current one.
+        today: Date to treat as today (default: now, UTC).
+
+    Returns:
+        Names of the partitions dropped.
+
+    Raises:
+        ValueError: retain_months is not positive.
+    """
+    if retain_months <= 0:
+        msg = "retain_months must be positive"
+        raise ValueError(msg)
+
+    cutoff, _ = message_partition_bounds(add_months(_current_month(today), -retain_months))
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name in list(await conn.scalars(_DETACH_PENDING)):
+            await _detach(conn, name, "FINALIZE")
+        for name, (_, upper) in sorted((await _partition_ranges(conn)).items()):
+            if upper is not None and upper <= cutoff:
+                await _detach(conn, name, "CONCURRENTLY")
+        detached = [name for name in await conn.scalars(_DETACHED) if _expired_table(name, cutoff)]
+
+    dropped = []
+    for name in sorted(detached):
+        async with engine.begin() as conn:
+            if await _drop_detached(conn, name):
+                dropped.append(name)
+    return dropped
+
+
+async def _detach(conn: AsyncConnection, name: str, mode: str) -> None:
+    """Detach a partition, tolerating another worker having just done so."""
+    try:
+        await conn.execute(text(f'ALTER TABLE faceplate.messages DETACH PARTITION faceplate."{name}" {mode}'))
+    except DBAPIError:
+        await conn.rollback()
+        if name in await conn.scalars(_ATTACHED):
+            raise
+        logger.info("Message partition %s was detached by another worker", name)
+
+
+def _expired_table(name: str, cutoff: UUID) -> bool:
+    """Whether a detached table's name says its month precedes cutoff."""
+    match = _MONTHLY_NAME.fullmatch(name)
+    if match is None:  # messages_legacy, detached only once expired
+        return True
+    _, upper = message_partition_bounds(date(int(match[1]), int(match[2]), 1))
+    return upper <= cutoff
+
+
+async def _drop_detached(conn: AsyncConnection, name: str) -> bool:
+    """Subtract a detached partition's rows from conversation summaries and drop it.
+
+    Returns:
+        False if another worker dropped it first.
+    """
+    await conn.execute(text(f"SET LOCAL lock_timeout = '{_LOCK_TIMEOUT}'"))
+    # Serializes drops across workers; held until commit
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY})
+    if name not in await conn.scalars(_DETACHED):
+        return False
+
+    await conn.execute(
+        text(
+            f"""
+            UPDATE faceplate.conversations AS c
+            SET message_count = c.message_count - expired.n,
+                last_message_at = CASE WHEN c.message_count = expired.n THEN NULL ELSE c.last_message_at END,
+                last_message_preview = CASE
+                    WHEN c.message_count = expired.n THEN NULL ELSE c.last_message_preview
+                END
+            FROM (
+                SELECT conversation_id, count(*) AS n FROM faceplate."{name}" GROUP BY conversation_id
+            ) AS expired
+            WHERE c.id = expired.conversation_id
+            """  # noqa: S608 - name comes from pg_class
+        )
+    )
+    await conn.execute(text(f'DROP TABLE faceplate."{name}"'))
+    return True
+
+
+async def maintain_message_partitions() -> None:
+    """Run one round of partition maintenance using the database settings.
+
+    Skips the round if another worker is already running one.
+    """
+    settings = get_settings().database
+
+    async def ensure(session: AsyncSession) -> list[str] | None:
+        if not await session.scalar(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}):
+            return None
+        return await ensure_message_partitions(session, months_ahead=settings.db_partitions_ahead)
+
+    created = await run_in_transaction(ensure)
+    if created is None:
+        return
+
+    dropped = []
+    if settings.db_message_retention_months:
+        dropped = await drop_expired_message_partitions(
+            get_engine(), retain_months=settings.db_message_retention_months
+        )
+    if created or dropped:
+        logger.info("Message partitions created: %s, dropped: %s", created, dropped)
+
+
+async def _maintain_periodically(interval: float) -> None:
+    while True:
+        try:
+            await maintain_message_partitions()
+        except Exception:
+            logger.exception("Message partition maintenance failed")
+        await asyncio.sleep(interval)
+
+
+def start_partition_maintenance(interval: float = 3600.0) -> None:
+    """Run maintain_message_partitions() now and then every ``interval`` seconds.
+
+    Call stop_partition_maintenance() on shutdown.
+
+    Args:
+        interval: Seconds between rounds (default: 1 hour).
+    """
+    global _maintenance_task
+    if _maintenance_task is None:
+        _maintenance_task = asyncio.create_task(_maintain_periodically(interval))
+
+
+async def stop_partition_maintenance() -> None:
+    """Stop the maintenance task started by start_partition_maintenance()."""
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _maintenance_task
+        _maintenance_task = None
@@ -0,0 +1,163 @@
+"""Connection pool instrumentation.
+
+InstrumentedPool records, per calling endpoint, how long requests wait for a
+connection, how long they hold it, how often they need overflow connections
+and how often they time out. Endpoints are attributed with
+set_current_endpoint(), typically from request middleware.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, PoolProxiedConnection
+
+UNKNOWN_ENDPOINT = "unknown"
+
+_current_endpoint: ContextVar[str] = ContextVar("db_current_endpoint", default=UNKNOWN_ENDPOINT)
+
+
+def set_current_endpoint(endpoint: str) -> None:
+    """Attribute pool usage in the current request to an endpoint.
+
+    Args:
+        endpoint: Label such as the route path, e.g. "GET /conversations".
+    """
+    _current_endpoint.set(endpoint)
+
+
+@dataclass
+class Timing:
+    """Count, sum and maximum of a duration in seconds."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, float]:
+        """Serialize with the mean for a metrics endpoint."""
+        mean = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "total": self.total, "mean": mean, "max": self.max}
+
+
+@dataclass
+class EndpointPoolStats:
+    """Pool usage attributed to one endpoint."""
+
+    checkouts: int = 0
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    wait: Timing = field(default_factory=Timing)
+    held: Timing = field(default_factory=Timing)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for a metrics endpoint."""
+        return {
+            "checkouts": self.checkouts,
+            "overflow_checkouts": self.overflow_checkouts,
+            "timeouts": self.timeouts,
+            "wait": self.wait.as_dict(),
+            "held": self.held.as_dict(),
+        }
+
+
+class PoolMetrics:
+    """Pool usage counters, broken down by endpoint."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.endpoints: dict[str, EndpointPoolStats] = {}
+        self.peak_overflow = 0
+
+    def record_checkout(self, endpoint: str, wait: float, overflow_in_use: int) -> None:
+        """Record a successful checkout.
+
+        Args:
+            endpoint: Endpoint that requested the connection.
+            wait: Seconds until a usable connection was handed out.
+            overflow_in_use: Connections checked out beyond pool_size, including this one.
+        """
+        stats = self._stats(endpoint)
+        stats.checkouts += 1
+        stats.wait.add(wait)
+        if overflow_in_use > 0:
+            stats.overflow_checkouts += 1
+            self.peak_overflow = max(self.peak_overflow, overflow_in_use)
+
+    def record_timeout(self, endpoint: str, wait: float) -> None:
+        """Record a checkout that gave up after pool_timeout."""
+        stats = self._stats(endpoint)
+        stats.timeouts += 1
+        stats.wait.add(wait)
+
+    def record_checkin(self, endpoint: str, held: float) -> None:
+        """Record how long a connection was held before being returned."""
+        self._stats(endpoint).held.add(held)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Serialize counters for a metrics endpoint."""
+        return {
+            "peak_overflow": self.peak_overflow,
+            "endpoints": {name: stats.as_dict() for name, stats in self.endpoints.items()},
+        }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self.endpoints.clear()
+        self.peak_overflow = 0
+
+    def _stats(self, endpoint: str) -> EndpointPoolStats:
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = EndpointPoolStats()
+        return stats
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that feeds a PoolMetrics."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool with empty metrics."""
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing the wait.
+
+        The wait includes opening a new connection and any checkout hooks
+        such as pre-ping, i.e. everything before the caller's first query.
+        """
+        endpoint = _current_endpoint.get()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(endpoint, time.perf_counter() - started)
+            raise
+
+        now = time.perf_counter()
+        self.metrics.record_checkout(endpoint, now - started, self.checkedout() - self.size())
+        connection.info["pool_checked_out_at"] = now
+        connection.info["pool_endpoint"] = endpoint
+        return connection
+
+    def recreate(self) -> "InstrumentedPool":
+        """Recreate the pool (e.g. on dispose), keeping accumulated metrics."""
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop("pool_checked_out_at", None)
+        endpoint = record.info.pop("pool_endpoint", UNKNOWN_ENDPOINT)
+        if checked_out_at is not None:
+            self.metrics.record_checkin(endpoint, time.perf_counter() - checked_out_at)
+        super()._do_return_conn(record)
@@ -4,11 +4,14 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DDL, ForeignKey, Index, String, event, func
+from sqlalchemy.orm import Mapped, WriteOnlyMapped, mapped_column, relationship
 
 from app.models.base import BaseModel
 
+# Characters of the latest message kept in last_message_preview
+LAST_MESSAGE_PREVIEW_LENGTH = 120
+
 if TYPE_CHECKING:
     from app.models.message import Message
     from app.models.user import User
@@ -22,7 +25,6 @@ class Conversation(BaseModel):
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("faceplate.users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     title: Mapped[str] = mapped_column(
         String(255),
@@ -40,19 +42,56 @@ class Conversation(BaseModel):
         onupdate=func.now(),
     )
 
+    # Sidebar summary, maintained by app.db.messages.add_message/delete_message
+    message_count: Mapped[int] = mapped_column(
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    last_message_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+    last_message_preview: Mapped[str | None] = mapped_column(
+        String(LAST_MESSAGE_PREVIEW_LENGTH),
+        nullable=True,
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(
         "User",
         back_populates="conversations",
     )
-    messages: Mapped[list["Message"]] = relationship(
+    # Write-only: never loaded as a whole. Read pages with app.db.messages.
+    messages: WriteOnlyMapped["Message"] = relationship(
         "Message",
         back_populates="conversation",
         cascade="all, delete-orphan",
         passive_deletes=True,
-        order_by="Message.created_at",
+        order_by="Message.id",
     )
 
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<Conversation(id={self.id}, title={self.title})>"
+
+
+# Conversation list pages: WHERE user_id = ? ORDER BY updated_at DESC, created_at DESC, id DESC.
+# Each page is one range scan of this index; the summary columns are read from
+# the rows it finds. title is included as created by migration 003.
+Index(
+    "ix_conversations_user_id_updated_at",
+    Conversation.user_id,
+    Conversation.updated_at.desc(),
+    Conversation.created_at.desc(),
+    Conversation.id.desc(),
+    postgresql_include=["title"],
+)
+
+# Leave room on each page so updates that touch no indexed column, such as the
+# summary columns, can be HOT, i.e. written without new index entries. See
+# migration 005 for existing databases.
+event.listen(
+    Conversation.__table__,
+    "after_create",
+    DDL("ALTER TABLE %(fullname)s SET (fillfactor = 80)").execute_if(dialect="postgresql"),
+)
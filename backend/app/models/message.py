@@ -1,10 +1,10 @@
 """Message model for Faceplate."""
 
-from datetime import datetime
+from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text, func
+from sqlalchemy import Connection, ForeignKey, Index, String, Table, Text, event, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,11 +18,16 @@ class Message(BaseModel):
     """Message model representing messages within conversations."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # History pages: WHERE conversation_id = ? ORDER BY id (uuid7, so time ordered)
+        Index("ix_messages_conversation_id_id", "conversation_id", "id"),
+        # Monthly partitions on the uuid7 id; see message_partition_bounds()
+        {"postgresql_partition_by": "RANGE (id)"},
+    )
 
     conversation_id: Mapped[UUID] = mapped_column(
         ForeignKey("faceplate.conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     role: Mapped[str] = mapped_column(
         String(20),
@@ -43,7 +48,6 @@ class Message(BaseModel):
     created_at: Mapped[datetime] = mapped_column(
         default=func.now(),
         server_default=func.now(),
-        index=True,
     )
 
     # Relationships
@@ -55,3 +59,56 @@ class Message(BaseModel):
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<Message(id={self.id}, role={self.role})>"
+
+
+# Partitions create_all makes beyond the current month
+INITIAL_PARTITIONS_AHEAD = 3
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month ``months`` after (or before) ``month``."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def message_partition_name(month: date) -> str:
+    """Name of the messages partition holding ``month``, e.g. messages_p2026_10."""
+    return f"messages_p{month:%Y_%m}"
+
+
+def message_partition_bounds(month: date) -> tuple[UUID, UUID]:
+    """Id range [lower, upper) of the messages partition holding ``month``.
+
+    A bound is the uuid7 timestamp of the month's first millisecond (UTC) with
+    every other bit zero, which sorts before any uuid7 issued from that
+    millisecond on and after any issued earlier.
+    """
+
+    def bound(day: date) -> UUID:
+        milliseconds = int(datetime(day.year, day.month, 1, tzinfo=UTC).timestamp() * 1000)
+        return UUID(int=milliseconds << 80)
+
+    return bound(month), bound(add_months(month, 1))
+
+
+def message_partition_ddl(month: date) -> str:
+    """CREATE TABLE statement for the messages partition holding ``month``."""
+    lower, upper = message_partition_bounds(month)
+    return (
+        f"CREATE TABLE IF NOT EXISTS faceplate.{message_partition_name(month)} "
+        f"PARTITION OF faceplate.messages FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+
+
+@event.listens_for(Message.__table__, "after_create")
+def _create_initial_partitions(target: Table, connection: Connection, **kw: Any) -> None:
+    """Give a table made by create_all (tests, local dev) partitions to insert into.
+
+    Databases managed by migrations get theirs from migration 007 and
+    app.db.partitions.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    current = datetime.now(UTC).date().replace(day=1)
+    for months in range(INITIAL_PARTITIONS_AHEAD + 1):
+        connection.execute(text(message_partition_ddl(add_months(current, months))))
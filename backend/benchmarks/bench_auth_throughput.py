@@ -0,0 +1,118 @@
+"""Benchmark: JWTValidator + JWKSCache throughput and latency.
+
+Starts a local JWKS server, mints RS256 tokens across rotating key IDs, and
+measures validations per second and p50/p99 latency at several concurrency
+levels for these scenarios:
+
+    warm         keys cached before the run
+    cold         empty cache; the first requests pay the JWKS fetch
+    expired      TTL elapsed; the next request refreshes inline
+    expired-swr  TTL elapsed with background refresh running (stale-while-revalidate)
+
+Usage:
+    uv run python -m benchmarks.bench_auth_throughput [--requests N] [--concurrency 1,10,50,200]
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+from app.auth.jwks import JWKSCache
+from app.auth.jwt import JWTValidator, VerificationMode
+from app.core.config import CognitoSettings
+from benchmarks.common import make_signing_key, mint_token
+from benchmarks.jwks_server import JWKSServer
+
+SCENARIOS = ("warm", "cold", "expired", "expired-swr")
+
+
+async def _prepare_cache(scenario: str, settings: CognitoSettings) -> JWKSCache:
+    """Build a JWKSCache in the state the scenario calls for."""
+    jwks_cache = JWKSCache(settings)
+    if scenario == "cold":
+        return jwks_cache
+
+    if scenario == "expired-swr":
+        await jwks_cache.start()
+    else:
+        await jwks_cache.refresh()
+
+    if scenario in ("expired", "expired-swr"):
+        jwks_cache._cache_timestamp = time.time() - jwks_cache._ttl - 1
+    return jwks_cache
+
+
+async def _drive(
+    validate: Callable[[str], Awaitable[object]],
+    tokens: list[str],
+    concurrency: int,
+    requests: int,
+) -> tuple[float, list[float]]:
+    """Run requests validations from concurrency workers; return elapsed and latencies."""
+    counter = itertools.count()
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        while (i := next(counter)) < requests:
+            start = time.perf_counter()
+            await validate(tokens[i % len(tokens)])
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct))]
+
+
+async def main() -> None:
+    """Run every scenario at every concurrency level and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000, help="validations per run")
+    parser.add_argument("--concurrency", default="1,10,50,200", help="comma-separated levels")
+    parser.add_argument("--kids", type=int, default=3, help="number of rotating signing keys")
+    parser.add_argument("--tokens", type=int, default=500, help="distinct tokens in the pool")
+    parser.add_argument("--jwks-latency-ms", type=float, default=50.0, help="simulated IdP round trip")
+    parser.add_argument("--verification-mode", default="inline", choices=["inline", "thread", "process"])
+    parser.add_argument("--workers", type=int, default=None, help="pool size for thread/process modes")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    scenarios = args.scenarios.split(",")
+    mode: VerificationMode = args.verification_mode
+
+    signing_keys = [make_signing_key(f"bench-key-{i}") for i in range(args.kids)]
+    tokens = [mint_token(signing_keys[i % len(signing_keys)], sub=f"user-{i}") for i in range(args.tokens)]
+
+    print(f"mode={mode} requests={args.requests} kids={args.kids} jwks_latency={args.jwks_latency_ms}ms")
+    print(f"{'scenario':12s} {'conc':>5s} {'val/s':>9s} {'p50 ms':>8s} {'p99 ms':>8s} {'max ms':>8s} {'fetches':>8s}")
+
+    with JWKSServer([key.public_jwk for key in signing_keys], latency=args.jwks_latency_ms / 1000) as server:
+        for scenario in scenarios:
+            for concurrency in levels:
+                jwks_cache = await _prepare_cache(scenario, server.settings)
+                validator = JWTValidator(server.settings, jwks_cache, verification_mode=mode, max_workers=args.workers)
+                fetches_before = server.request_count
+                try:
+                    elapsed, latencies = await _drive(validator.validate_token, tokens, concurrency, args.requests)
+                finally:
+                    validator.close()
+                    await jwks_cache.close()
+
+                latencies_ms = sorted(latency * 1000 for latency in latencies)
+                print(
+                    f"{scenario:12s} {concurrency:5d} {len(latencies) / elapsed:9.0f}"
+                    f" {statistics.median(latencies_ms):8.2f} {_percentile(latencies_ms, 0.99):8.2f}"
+                    f" {latencies_ms[-1]:8.2f} {server.request_count - fetches_before:8d}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+"""Microbenchmark: RS256 validation with raw JWK dicts vs pre-built key objects.
+
+Usage:
+    uv run python -m benchmarks.bench_key_objects [--iterations N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from jose import jwk, jwt
+
+from benchmarks.common import BENCH_SETTINGS, make_signing_key, mint_token
+
+
+def _rate(fn: Callable[[], Any], iterations: int) -> float:
+    """Return calls per second for fn over the given iterations."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print validations per second."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    signing_key = make_signing_key("bench-key")
+    token = mint_token(signing_key)
+    public_jwk = signing_key.public_jwk
+    key_object = jwk.construct(public_jwk, "RS256")
+
+    def decode_with(key: Any) -> Callable[[], Any]:
+        return lambda: jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            audience=BENCH_SETTINGS.cognito_app_client_id,
+            issuer=BENCH_SETTINGS.issuer,
+        )
+
+    # Warm up both paths
+    _rate(decode_with(public_jwk), 100)
+    _rate(decode_with(key_object), 100)
+
+    before = _rate(decode_with(public_jwk), args.iterations)
+    after = _rate(decode_with(key_object), args.iterations)
+
+    print(f"raw JWK dict:      {before:10.0f} validations/s")
+    print(f"pre-built key:     {after:10.0f} validations/s")
+    print(f"speedup:           {after / before:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: event-loop lag while validating tokens in each verification mode.
+
+A ticker coroutine sleeps 1 ms in a loop and records how late it wakes up
+while N concurrent validate_token calls run. Lag is the cost every other
+connection on the worker pays during a login burst.
+
+Usage:
+    uv run python -m benchmarks.bench_verification_modes [--concurrency N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.auth.jwks import JWKSCache
+from app.auth.jwt import JWTValidator, VerificationMode
+from benchmarks.common import BENCH_SETTINGS, make_signing_key, mint_token
+
+TICK = 0.001
+
+
+async def _ticker(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how late each 1 ms sleep wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _run_mode(mode: VerificationMode, tokens: list[str], jwks_cache: JWKSCache, workers: int) -> None:
+    """Validate all tokens concurrently and print lag and throughput."""
+    validator = JWTValidator(BENCH_SETTINGS, jwks_cache, verification_mode=mode, max_workers=workers)
+    try:
+        # Warm the pool so worker start-up is not measured
+        await asyncio.gather(*(validator.validate_token(token) for token in tokens[:workers]))
+
+        stop = asyncio.Event()
+        lags: list[float] = []
+        ticker = asyncio.create_task(_ticker(stop, lags))
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(validator.validate_token(token) for token in tokens))
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await ticker
+    finally:
+        validator.close()
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{mode:8s} {len(tokens) / elapsed:10.0f} validations/s"
+        f"   loop lag p50 {statistics.median(lags_ms):7.2f} ms"
+        f"   p99 {p99:7.2f} ms   max {lags_ms[-1]:7.2f} ms"
+        f"   ticks {len(lags):5d}"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark for every verification mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    signing_key = make_signing_key("bench-key")
+    # Distinct tokens so no layer can short-circuit repeat validations
+    tokens = [mint_token(signing_key, sub=f"user-{i}") for i in range(args.concurrency)]
+
+    jwks_cache = JWKSCache(BENCH_SETTINGS)
+    jwks_cache._update_cache({"keys": [signing_key.public_jwk]})
+
+    for mode in ("inline", "thread", "process"):
+        await _run_mode(mode, tokens, jwks_cache, args.workers)
+
+    await jwks_cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Shared helpers for auth benchmarks: RSA keys, JWKs, and signed tokens."""
+
+import base64
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwt
+
+from app.core.config import CognitoSettings
+
+BENCH_SETTINGS = CognitoSettings(
+    cognito_region="us-east-1",
+    cognito_user_pool_id="us-east-1_Bench",
+    cognito_app_client_id="bench-client-id",
+)
+
+
+def _int_to_base64url(n: int) -> str:
+    """Encode an integer as unpadded base64url."""
+    data = n.to_bytes((n.bit_length() + 7) // 8, byteorder="big")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+@dataclass
+class SigningKey:
+    """RSA signing key with its key ID."""
+
+    kid: str
+    private_pem: bytes
+    public_jwk: dict[str, Any]
+
+
+def make_signing_key(kid: str) -> SigningKey:
+    """Generate a 2048-bit RSA signing key."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    numbers = private_key.public_key().public_numbers()
+    public_jwk = {
+        "kty": "RSA",
+        "kid": kid,
+        "use": "sig",
+        "alg": "RS256",
+        "n": _int_to_base64url(numbers.n),
+        "e": _int_to_base64url(numbers.e),
+    }
+    return SigningKey(kid=kid, private_pem=private_pem, public_jwk=public_jwk)
+
+
+def mint_token(key: SigningKey, sub: str = "bench", ttl: int = 3600) -> str:
+    """Sign a Cognito-shaped token accepted by BENCH_SETTINGS."""
+    now = int(time.time())
+    claims = {
+        "sub": sub,
+        "email": f"{sub}@example.com",
+        "iss": BENCH_SETTINGS.issuer,
+        "aud": BENCH_SETTINGS.cognito_app_client_id,
+        "iat": now,
+        "exp": now + ttl,
+    }
+    return jwt.encode(claims, key.private_pem, algorithm="RS256", headers={"kid": key.kid})
@@ -0,0 +1,93 @@
+"""Local JWKS HTTP stand-in for auth benchmarks."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from app.core.config import CognitoSettings
+from benchmarks.common import BENCH_SETTINGS
+
+
+class LocalCognitoSettings(CognitoSettings):
+    """Cognito settings whose JWKS URL points at a local server."""
+
+    local_jwks_url: str
+
+    @property
+    def jwks_url(self) -> str:
+        """JWKS endpoint URL of the local stand-in."""
+        return self.local_jwks_url
+
+
+class JWKSServer:
+    """Serves a JWKS document on 127.0.0.1 with optional artificial latency.
+
+    Usage:
+        with JWKSServer([key.public_jwk], latency=0.05) as server:
+            settings = server.settings
+    """
+
+    def __init__(self, keys: list[dict[str, Any]], latency: float = 0.0) -> None:
+        """Initialize the server.
+
+        Args:
+            keys: Public JWKs to serve.
+            latency: Seconds to sleep before each response (simulated round trip).
+        """
+        self.keys = keys
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """URL of the JWKS document."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/.well-known/jwks.json"
+
+    @property
+    def settings(self) -> LocalCognitoSettings:
+        """Settings that validate BENCH_SETTINGS tokens against this server."""
+        return LocalCognitoSettings(
+            cognito_region=BENCH_SETTINGS.cognito_region,
+            cognito_user_pool_id=BENCH_SETTINGS.cognito_user_pool_id,
+            cognito_app_client_id=BENCH_SETTINGS.cognito_app_client_id,
+            local_jwks_url=self.url,
+        )
+
+    def __enter__(self) -> "JWKSServer":
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Build a request handler bound to this server instance."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with server._lock:
+                    server.request_count += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                body = json.dumps({"keys": server.keys}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return Handler
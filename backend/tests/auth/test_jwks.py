@@ -1,11 +1,16 @@
 """Tests for JWKS caching."""
 
+import asyncio
+import json
 import time
+from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+from jose import jwk
+from jose.backends.base import Key
 
 from app.auth.exceptions import JWKSFetchError, KeyNotFoundError
 from app.auth.jwks import JWKSCache
@@ -170,6 +175,25 @@ class TestJWKSCache:
         with patch.object(cache._client, "get", side_effect=mock_get), pytest.raises(JWKSFetchError):
             await cache.get_key("any-kid")
 
+    @pytest.mark.parametrize(
+        "body",
+        [json.JSONDecodeError("Expecting value", "<html>", 0), ["not", "a", "jwks"], {"keys": "x"}, {"keys": ["x"]}],
+    )
+    async def test_invalid_response_raises_fetch_error(self, cache: JWKSCache, body: Any) -> None:
+        """A non-JSON or malformed JWKS body is reported as a fetch failure."""
+        mock_response = MagicMock()
+        if isinstance(body, Exception):
+            mock_response.json.side_effect = body
+        else:
+            mock_response.json.return_value = body
+        mock_response.raise_for_status.return_value = None
+
+        async def mock_get(*args, **kwargs):
+            return mock_response
+
+        with patch.object(cache._client, "get", side_effect=mock_get), pytest.raises(JWKSFetchError):
+            await cache.get_key("any-kid")
+
     async def test_refresh_method(
         self,
         cache: JWKSCache,
@@ -186,3 +210,510 @@ class TestJWKSCache:
 
             mock_get_method.assert_called_once()
             assert cache._keys is not None
+
+    async def test_public_key_built_once_per_refresh(
+        self,
+        cache: JWKSCache,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Key objects are constructed on refresh and reused across lookups."""
+        mock_response = self._create_mock_response(mock_jwks)
+
+        async def mock_get(*args, **kwargs):
+            return mock_response
+
+        with (
+            patch.object(cache._client, "get", side_effect=mock_get),
+            patch("app.auth.jwks.jwk.construct", wraps=jwk.construct) as mock_construct,
+        ):
+            first = await cache.get_public_key(mock_key_pair.kid)
+            second = await cache.get_public_key(mock_key_pair.kid)
+
+        assert isinstance(first, Key)
+        assert first is second
+        assert mock_construct.call_count == 1
+
+
+class TestJWKSSingleFlight:
+    """Tests for coalescing concurrent JWKS refreshes."""
+
+    @pytest.fixture
+    def cache(self, mock_cognito_settings: dict[str, str]) -> JWKSCache:
+        """Create a JWKSCache instance."""
+        return JWKSCache(CognitoSettings(**mock_cognito_settings), ttl=3600)
+
+    async def test_concurrent_callers_share_one_fetch(
+        self,
+        cache: JWKSCache,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """N concurrent get_key calls on a cold cache trigger exactly one HTTP request."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_jwks
+        mock_response.raise_for_status.return_value = None
+        call_count = 0
+
+        async def mock_get(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            keys = await asyncio.gather(*(cache.get_key(mock_key_pair.kid) for _ in range(50)))
+
+        assert call_count == 1
+        assert all(key["kid"] == mock_key_pair.kid for key in keys)
+
+    async def test_concurrent_callers_share_error(self, cache: JWKSCache) -> None:
+        """All waiters receive the error from the single failed fetch."""
+        call_count = 0
+
+        async def mock_get(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            raise httpx.HTTPError("Connection failed")
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            results = await asyncio.gather(*(cache.get_key("any-kid") for _ in range(20)), return_exceptions=True)
+
+        assert call_count == 1
+        assert all(isinstance(result, JWKSFetchError) for result in results)
+
+
+class TestJWKSBackgroundRefresh:
+    """Tests for proactive background refresh."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    def _create_mock_response(self, mock_jwks: dict[str, Any]) -> MagicMock:
+        """Create a mock httpx response."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = mock_jwks
+        mock_response.raise_for_status.return_value = None
+        return mock_response
+
+    async def test_start_warms_cache(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """start() fetches keys so the first lookup needs no network call."""
+        cache = JWKSCache(cognito_settings)
+        mock_response = self._create_mock_response(mock_jwks)
+
+        with patch.object(cache._client, "get", new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await cache.start()
+            await cache.get_key(mock_key_pair.kid)
+            await cache.close()
+
+        mock_get.assert_awaited_once()
+
+    async def test_expired_keys_served_while_revalidating(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Lookups past TTL return current keys instead of fetching inline."""
+        cache = JWKSCache(cognito_settings)
+        mock_response = self._create_mock_response(mock_jwks)
+
+        with patch.object(cache._client, "get", new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            await cache.start()
+            cache._cache_timestamp = time.time() - cache._ttl - 1
+
+            with patch.object(cache, "_seconds_until_refresh", return_value=3600):
+                key = await cache.get_key(mock_key_pair.kid)
+
+            await cache.close()
+
+        assert key["kid"] == mock_key_pair.kid
+        mock_get.assert_awaited_once()
+
+    async def test_background_retries_with_backoff(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Failed background refreshes are retried until one succeeds."""
+        cache = JWKSCache(cognito_settings, retry_backoff=0.01, max_retry_backoff=0.02)
+        mock_response = self._create_mock_response(mock_jwks)
+        refreshed = asyncio.Event()
+        call_count = 0
+
+        async def mock_get(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise httpx.HTTPError("Connection failed")
+            refreshed.set()
+            return mock_response
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.start()
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+            await cache.close()
+
+        assert call_count == 3
+        assert cache._keys
+        assert cache._background_task is None
+
+    async def test_background_survives_unexpected_error(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """An unexpected error is logged and retried instead of ending the task."""
+        cache = JWKSCache(cognito_settings, retry_backoff=0.01, max_retry_backoff=0.02)
+        mock_response = self._create_mock_response(mock_jwks)
+        refreshed = asyncio.Event()
+        call_count = 0
+
+        async def mock_get(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise httpx.HTTPError("Connection failed")
+            if call_count < 4:
+                raise RuntimeError("unexpected")
+            refreshed.set()
+            return mock_response
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.start()
+            await asyncio.wait_for(refreshed.wait(), timeout=1)
+            assert not cache._background_task.done()
+            await cache.close()
+
+        assert call_count == 4
+        assert cache._keys
+
+    async def test_expired_keys_refreshed_inline_if_task_died(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Stale keys are not served once the background task has stopped."""
+        cache = JWKSCache(cognito_settings)
+        mock_response = self._create_mock_response(mock_jwks)
+
+        with patch.object(cache._client, "get", new_callable=AsyncMock, return_value=mock_response) as mock_get:
+            with patch.object(cache, "_background_refresh", new_callable=AsyncMock, side_effect=RuntimeError("died")):
+                await cache.start()
+                await asyncio.sleep(0)
+            assert cache._background_task.done()
+
+            cache._cache_timestamp = time.time() - cache._ttl - 1
+            await cache.get_key(mock_key_pair.kid)
+            await cache.close()
+
+        assert mock_get.await_count == 2
+
+    async def test_close_cancels_in_flight_refresh(self, cognito_settings: CognitoSettings) -> None:
+        """close() stops a shared fetch still running after its waiters are gone."""
+        cache = JWKSCache(cognito_settings)
+        started = asyncio.Event()
+
+        async def mock_get(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(3600)
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            waiter = asyncio.create_task(cache.refresh())
+            await started.wait()
+            waiter.cancel()
+            refresh_task = cache._refresh_task
+            await cache.close()
+
+        assert refresh_task is not None
+        assert refresh_task.cancelled()
+
+
+class TestJWKSUnknownKid:
+    """Tests for refresh-on-miss and negative caching of unknown key IDs."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    @staticmethod
+    def _counting_get(responses: list[dict[str, Any]]) -> tuple[Any, list[int]]:
+        """Build a mock get returning successive JWKS documents."""
+        calls = [0]
+
+        async def mock_get(*args, **kwargs):
+            jwks = responses[min(calls[0], len(responses) - 1)]
+            calls[0] += 1
+            mock_response = MagicMock()
+            mock_response.json.return_value = jwks
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+
+        return mock_get, calls
+
+    async def test_rotated_kid_fetched_immediately(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """A kid missing from a fresh cache triggers one refresh and succeeds."""
+        cache = JWKSCache(cognito_settings, miss_refresh_interval=0)
+        rotated = {"keys": [{**mock_key_pair.get_public_jwk(), "kid": "rotated-kid"}]}
+        mock_get, calls = self._counting_get([mock_jwks, rotated])
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.get_key(mock_key_pair.kid)
+            key = await cache.get_key("rotated-kid")
+
+        assert key["kid"] == "rotated-kid"
+        assert calls[0] == 2
+
+    async def test_concurrent_callers_for_rotated_kid_share_refresh(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Concurrent lookups of a new kid all wait for the one refresh it triggers."""
+        cache = JWKSCache(cognito_settings)
+        rotated = {"keys": [{**mock_key_pair.get_public_jwk(), "kid": "rotated-kid"}]}
+        counting_get, calls = self._counting_get([mock_jwks, rotated])
+
+        async def slow_get(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return await counting_get(*args, **kwargs)
+
+        with patch.object(cache._client, "get", side_effect=slow_get):
+            await cache.get_key(mock_key_pair.kid)
+            # Outside the default miss-refresh interval, but well within the TTL
+            cache._cache_timestamp = time.time() - 60
+            keys = await asyncio.gather(*(cache.get_public_key("rotated-kid") for _ in range(20)))
+
+        assert len(keys) == 20
+        assert calls[0] == 2
+
+    async def test_bogus_kid_negatively_cached(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Repeated lookups of a bogus kid refresh only once."""
+        cache = JWKSCache(cognito_settings, miss_refresh_interval=0)
+        mock_get, calls = self._counting_get([mock_jwks])
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.get_key(mock_key_pair.kid)
+            for _ in range(10):
+                with pytest.raises(KeyNotFoundError):
+                    await cache.get_key("bogus-kid")
+
+        assert calls[0] == 2
+
+    async def test_kid_not_remembered_when_refresh_fails(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """A kid missed during a JWKS outage is looked up again once the IdP recovers."""
+        cache = JWKSCache(cognito_settings, miss_refresh_interval=0)
+        rotated = {"keys": [{**mock_key_pair.get_public_jwk(), "kid": "rotated-kid"}]}
+        mock_get, _ = self._counting_get([mock_jwks, rotated])
+        outage = [False]
+
+        async def flaky_get(*args, **kwargs):
+            if outage[0]:
+                raise httpx.ConnectError("Connection refused")
+            return await mock_get(*args, **kwargs)
+
+        with patch.object(cache._client, "get", side_effect=flaky_get):
+            await cache.get_key(mock_key_pair.kid)
+            outage[0] = True
+            with pytest.raises(KeyNotFoundError):
+                await cache.get_key("rotated-kid")
+            outage[0] = False
+            key = await cache.get_key("rotated-kid")
+
+        assert key["kid"] == "rotated-kid"
+
+    async def test_miss_refresh_rate_limited(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Distinct unknown kids do not refresh again within the interval."""
+        cache = JWKSCache(cognito_settings, miss_refresh_interval=3600)
+        mock_get, calls = self._counting_get([mock_jwks])
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.get_key(mock_key_pair.kid)
+            for i in range(10):
+                with pytest.raises(KeyNotFoundError):
+                    await cache.get_key(f"bogus-kid-{i}")
+
+        assert calls[0] == 1
+
+
+class TestJWKSConditionalFetch:
+    """Tests for ETag revalidation and Cache-Control TTLs."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    @staticmethod
+    def _response(status_code: int, jwks: dict[str, Any] | None = None, **headers: str) -> httpx.Response:
+        """Build a real httpx response for the JWKS URL."""
+        request = httpx.Request("GET", "https://example.com/.well-known/jwks.json")
+        return httpx.Response(status_code, json=jwks, headers=headers, request=request)
+
+    async def test_not_modified_extends_ttl(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """A 304 keeps current keys, resets the TTL, and skips parsing."""
+        cache = JWKSCache(cognito_settings)
+        responses = [
+            self._response(200, mock_jwks, ETag='"v1"', **{"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+            self._response(304),
+        ]
+        sent_headers: list[dict[str, str]] = []
+
+        async def mock_get(url, headers=None, **kwargs):
+            sent_headers.append(headers or {})
+            return responses.pop(0)
+
+        with patch.object(cache._client, "get", side_effect=mock_get):
+            await cache.get_key(mock_key_pair.kid)
+            cache._cache_timestamp = time.time() - cache._ttl - 1
+            with patch.object(cache, "_update_cache") as mock_update:
+                key = await cache.get_key(mock_key_pair.kid)
+
+        assert key["kid"] == mock_key_pair.kid
+        mock_update.assert_not_called()
+        assert not cache._is_cache_expired()
+        assert sent_headers[0] == {}
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+        assert sent_headers[1]["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @pytest.mark.parametrize(
+        ("cache_control", "expected_ttl"),
+        [
+            ("public, max-age=7200", 7200),
+            ("max-age=10", 300),
+            ("max-age=999999", 86400),
+            ("no-store", 300),
+            (None, 3600),
+        ],
+    )
+    async def test_cache_control_ttl_clamped(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        cache_control: str | None,
+        expected_ttl: int,
+    ) -> None:
+        """Server max-age sets the TTL within the configured bounds."""
+        cache = JWKSCache(cognito_settings, ttl=3600, respect_cache_control=True, min_ttl=300, max_ttl=86400)
+        headers = {"Cache-Control": cache_control} if cache_control else {}
+        response = self._response(200, mock_jwks, **headers)
+
+        with patch.object(cache._client, "get", new_callable=AsyncMock, return_value=response):
+            await cache.refresh()
+
+        assert cache._current_ttl == expected_ttl
+
+    async def test_cache_control_ignored_by_default(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Without opting in, the configured TTL is used."""
+        cache = JWKSCache(cognito_settings, ttl=3600)
+        response = self._response(200, mock_jwks, **{"Cache-Control": "max-age=60"})
+
+        with patch.object(cache._client, "get", new_callable=AsyncMock, return_value=response):
+            await cache.refresh()
+
+        assert cache._current_ttl == 3600
+
+
+class TestJWKSSnapshot:
+    """Tests for the on-disk JWKS snapshot."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    @staticmethod
+    def _response(jwks: dict[str, Any]) -> httpx.Response:
+        """Build a real httpx response for the JWKS URL."""
+        request = httpx.Request("GET", "https://example.com/.well-known/jwks.json")
+        return httpx.Response(200, json=jwks, headers={"ETag": '"v1"'}, request=request)
+
+    async def test_snapshot_written_and_loaded(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+        tmp_path: Path,
+    ) -> None:
+        """A fresh worker serves keys from the snapshot with no network call."""
+        snapshot = tmp_path / "jwks.json"
+        first = JWKSCache(cognito_settings, snapshot_path=snapshot)
+
+        with patch.object(first._client, "get", new_callable=AsyncMock, return_value=self._response(mock_jwks)):
+            await first.refresh()
+
+        assert json.loads(snapshot.read_text())["etag"] == '"v1"'
+
+        second = JWKSCache(cognito_settings, snapshot_path=snapshot)
+        with patch.object(second._client, "get", new_callable=AsyncMock) as mock_get:
+            key = await second.get_key(mock_key_pair.kid)
+            await second.start()
+            await second.close()
+
+        assert key["kid"] == mock_key_pair.kid
+        mock_get.assert_not_awaited()
+        assert second._etag == '"v1"'
+
+    async def test_expired_snapshot_ignored(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        tmp_path: Path,
+    ) -> None:
+        """Snapshots older than their TTL are not loaded."""
+        snapshot = tmp_path / "jwks.json"
+        snapshot.write_text(json.dumps({"fetched_at": time.time() - 7200, "ttl": 3600, "jwks": mock_jwks}))
+
+        cache = JWKSCache(cognito_settings, snapshot_path=snapshot)
+
+        assert cache._keys == {}
+        assert cache._is_cache_expired()
+
+    async def test_corrupt_snapshot_ignored(self, cognito_settings: CognitoSettings, tmp_path: Path) -> None:
+        """Unreadable snapshots fall back to an empty cache."""
+        snapshot = tmp_path / "jwks.json"
+        snapshot.write_text("{not json")
+
+        cache = JWKSCache(cognito_settings, snapshot_path=snapshot)
+
+        assert cache._keys == {}
@@ -233,3 +233,114 @@ class TestTokenValidation:
             mock_fetch.return_value = mock_jwks
             with pytest.raises(TokenInvalidError, match=r"audience|aud"):
                 await validator.validate_token(token)
+
+
+# =============================================================================
+# Verification Execution Modes
+# =============================================================================
+
+
+class TestVerificationModes:
+    """Tests for running signature verification off the event loop."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    async def test_valid_token_in_each_mode(
+        self,
+        cognito_settings: CognitoSettings,
+        valid_token: str,
+        mock_jwks: dict[str, Any],
+        mode: str,
+    ) -> None:
+        """Valid tokens pass regardless of where verification runs."""
+        validator = JWTValidator(cognito_settings, verification_mode=mode, max_workers=1)
+        try:
+            with patch.object(validator, "_fetch_jwks", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = mock_jwks
+                claims = await validator.validate_token(valid_token)
+        finally:
+            validator.close()
+
+        assert claims.sub == "test-user-123"
+
+    async def test_worker_errors_are_mapped(
+        self,
+        cognito_settings: CognitoSettings,
+        expired_token: str,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Errors raised in a worker surface as the usual auth exceptions."""
+        validator = JWTValidator(cognito_settings, verification_mode="thread", max_workers=1)
+        try:
+            with patch.object(validator, "_fetch_jwks", new_callable=AsyncMock) as mock_fetch:
+                mock_fetch.return_value = mock_jwks
+                with pytest.raises(TokenExpiredError):
+                    await validator.validate_token(expired_token)
+        finally:
+            validator.close()
+
+    def test_unknown_mode_rejected(self, cognito_settings: CognitoSettings) -> None:
+        """Unknown verification modes are rejected at construction."""
+        with pytest.raises(ValueError, match="verification_mode"):
+            JWTValidator(cognito_settings, verification_mode="gpu")  # type: ignore[arg-type]
+
+
+# =============================================================================
+# Batch Validation
+# =============================================================================
+
+
+class TestBatchValidation:
+    """Tests for validate_tokens."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    @pytest.fixture
+    def validator(self, cognito_settings: CognitoSettings) -> JWTValidator:
+        """Create a JWTValidator instance."""
+        return JWTValidator(cognito_settings)
+
+    async def test_results_in_input_order(
+        self,
+        validator: JWTValidator,
+        valid_token: str,
+        expired_token: str,
+        unknown_key_token: str,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Each token gets its claims or error, aligned with the input."""
+        tokens = [valid_token, "not-a-jwt", expired_token, unknown_key_token, valid_token]
+
+        with patch.object(validator, "_fetch_jwks", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = mock_jwks
+            results = await validator.validate_tokens(tokens)
+
+        assert isinstance(results[0], TokenClaims)
+        assert isinstance(results[1], TokenInvalidError)
+        assert isinstance(results[2], TokenExpiredError)
+        assert isinstance(results[3], KeyNotFoundError)
+        assert results[4] is results[0]
+
+    async def test_dedupes_tokens_and_kids(
+        self,
+        validator: JWTValidator,
+        valid_token: str,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Identical tokens are verified once and each kid is resolved once."""
+        with (
+            patch.object(validator, "_fetch_jwks", new_callable=AsyncMock, return_value=mock_jwks) as mock_fetch,
+            patch.object(validator, "_verify", wraps=validator._verify) as mock_verify,
+        ):
+            results = await validator.validate_tokens([valid_token] * 5)
+
+        assert all(isinstance(result, TokenClaims) for result in results)
+        assert mock_fetch.await_count == 1
+        assert mock_verify.await_count == 1
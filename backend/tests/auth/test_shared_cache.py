@@ -0,0 +1,197 @@
+"""Tests for the host-wide shared auth cache."""
+
+import multiprocessing
+import sqlite3
+import stat
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.auth.jwks import JWKSCache
+from app.auth.jwt import TokenClaims
+from app.auth.shared_cache import SharedTokenStore
+from app.auth.token_cache import TokenCache
+from app.core.config import CognitoSettings
+
+from .conftest import MockKeyPair
+
+
+def _claims(sub: str, exp_offset: int = 3600) -> TokenClaims:
+    """Build TokenClaims expiring exp_offset seconds from now."""
+    now = int(time.time())
+    return TokenClaims(sub=sub, email=f"{sub}@example.com", exp=now + exp_offset, iat=now, iss="issuer")
+
+
+def _put_from_worker(path: str, index: int) -> None:
+    """Worker process: cache claims for a token unique to this worker."""
+    store = SharedTokenStore(path)
+    TokenCache(shared_store=store).put(f"token.{index}.sig", _claims(f"user-{index}"))
+    store.close()
+
+
+def _get_from_worker(path: str, token: str) -> str | None:
+    """Worker process: look up a token cached by another process."""
+    cache = TokenCache(shared_store=SharedTokenStore(path))
+    claims = cache.get(token)
+    return claims.sub if claims else None
+
+
+def _hold_write_lock(path: str, locked: Any, release: Any) -> None:
+    """Worker process: hold the database write lock until told to release it."""
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("INSERT OR REPLACE INTO tokens (digest, claims, expires_at) VALUES (x'00', '{}', 0)")
+    locked.set()
+    release.wait(5)
+    conn.execute("COMMIT")
+    conn.close()
+
+
+class TestSharedTokenStore:
+    """Tests for SharedTokenStore and its TokenCache integration."""
+
+    def test_roundtrip_and_expiry(self, tmp_path: Path) -> None:
+        """Stored values are returned until they expire."""
+        store = SharedTokenStore(tmp_path / "auth.db")
+
+        store.put(b"live", "{}", time.time() + 60)
+        store.put(b"dead", "{}", time.time() - 1)
+        store.flush()
+
+        assert store.get(b"live") == "{}"
+        assert store.get(b"dead") is None
+
+    def test_file_is_owner_only(self, tmp_path: Path) -> None:
+        """The store is created readable and writable by the owner only."""
+        path = tmp_path / "auth.db"
+        SharedTokenStore(path)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_claims_shared_between_caches(self, tmp_path: Path) -> None:
+        """A token validated through one cache is a hit in another."""
+        path = tmp_path / "auth.db"
+        first_store = SharedTokenStore(path)
+        first = TokenCache(shared_store=first_store)
+        second = TokenCache(shared_store=SharedTokenStore(path))
+        claims = _claims("shared")
+
+        first.put("a.b.c", claims)
+        first_store.flush()
+
+        assert second.get("a.b.c") == claims
+        assert second.shared_hits == 1
+
+    def test_clear_reaches_shared_tier(self, tmp_path: Path) -> None:
+        """Clearing one cache (e.g. on key rotation) clears it for all workers."""
+        path = tmp_path / "auth.db"
+        first_store = SharedTokenStore(path)
+        second_store = SharedTokenStore(path)
+        first = TokenCache(shared_store=first_store)
+        second = TokenCache(shared_store=second_store)
+        first.put("a.b.c", _claims("shared"))
+        first_store.flush()
+
+        second.clear()
+        second_store.flush()
+
+        assert TokenCache(shared_store=SharedTokenStore(path)).get("a.b.c") is None
+
+    def test_unavailable_store_falls_back(self, tmp_path: Path) -> None:
+        """An unusable path disables the shared tier without breaking the cache."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        store = SharedTokenStore(blocker / "auth.db")
+        cache = TokenCache(shared_store=store)
+        claims = _claims("local")
+
+        cache.put("a.b.c", claims)
+
+        assert not store.available
+        assert cache.get("a.b.c") == claims
+
+    def test_multiple_processes_share_claims(self, tmp_path: Path) -> None:
+        """Claims cached in separate processes are visible to each other."""
+        path = str(tmp_path / "auth.db")
+        ctx = multiprocessing.get_context("spawn")
+
+        with ctx.Pool(3) as pool:
+            pool.starmap(_put_from_worker, [(path, i) for i in range(3)])
+
+        parent = TokenCache(shared_store=SharedTokenStore(path))
+        assert [parent.get(f"token.{i}.sig").sub for i in range(3)] == ["user-0", "user-1", "user-2"]
+
+        parent.put("parent.token.sig", _claims("parent"))
+        parent._shared_store.flush()
+        with ctx.Pool(2) as pool:
+            results = pool.starmap(_get_from_worker, [(path, "parent.token.sig"), (path, "missing.token.sig")])
+
+        assert results == ["parent", None]
+
+    def test_lock_held_by_another_process_never_blocks_caller(self, tmp_path: Path) -> None:
+        """While another worker holds the write lock, lookups and writes return at once."""
+        path = str(tmp_path / "auth.db")
+        store = SharedTokenStore(path)
+        store.put(b"before", "{}", time.time() + 60)
+        store.flush()
+
+        ctx = multiprocessing.get_context("spawn")
+        locked, release = ctx.Event(), ctx.Event()
+        holder = ctx.Process(target=_hold_write_lock, args=(path, locked, release))
+        holder.start()
+        try:
+            assert locked.wait(10)
+
+            start = time.perf_counter()
+            for i in range(50):
+                store.put(i.to_bytes(4, "big"), "{}", time.time() + 60)
+                assert store.get(b"before") == "{}"
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+            holder.join(10)
+
+        # Waiting on the lock would take at least busy_timeout per call
+        assert elapsed < 0.25
+        store.flush()
+        assert all(store.get(i.to_bytes(4, "big")) == "{}" for i in range(50))
+        store.close()
+
+
+class TestHostSharedJWKS:
+    """Tests for sharing fetched keys between workers through the snapshot."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    async def test_peer_snapshot_adopted_instead_of_fetch(
+        self,
+        cognito_settings: CognitoSettings,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+        tmp_path: Path,
+    ) -> None:
+        """A worker whose keys expire adopts keys another worker just fetched."""
+        snapshot = tmp_path / "jwks.json"
+        request = httpx.Request("GET", "https://example.com/.well-known/jwks.json")
+        response = httpx.Response(200, json=mock_jwks, request=request)
+
+        # Both workers start empty; the first one fetches
+        first = JWKSCache(cognito_settings, snapshot_path=snapshot)
+        second = JWKSCache(cognito_settings, snapshot_path=snapshot)
+
+        with patch.object(first._client, "get", new_callable=AsyncMock, return_value=response) as first_get:
+            await first.get_key(mock_key_pair.kid)
+
+        with patch.object(second._client, "get", new_callable=AsyncMock, return_value=response) as second_get:
+            key = await second.get_key(mock_key_pair.kid)
+
+        first_get.assert_awaited_once()
+        second_get.assert_not_awaited()
+        assert key["kid"] == mock_key_pair.kid
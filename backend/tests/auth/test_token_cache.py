@@ -0,0 +1,115 @@
+"""Tests for the validated-token cache."""
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.auth.jwks import JWKSCache
+from app.auth.jwt import JWTValidator, TokenClaims
+from app.auth.token_cache import TokenCache
+from app.core.config import CognitoSettings
+
+from .conftest import MockKeyPair
+
+
+def _claims(sub: str = "user", exp_offset: int = 3600) -> TokenClaims:
+    """Build TokenClaims expiring exp_offset seconds from now."""
+    now = int(time.time())
+    return TokenClaims(sub=sub, email=f"{sub}@example.com", exp=now + exp_offset, iat=now, iss="issuer")
+
+
+class TestTokenCache:
+    """Tests for TokenCache behaviour."""
+
+    def test_miss_then_hit(self) -> None:
+        """Stored claims are returned and counted as hits."""
+        cache = TokenCache(max_size=4)
+        claims = _claims()
+
+        assert cache.get("a.b.c") is None
+        cache.put("a.b.c", claims)
+
+        assert cache.get("a.b.c") is claims
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_expired_entry_evicted(self) -> None:
+        """Entries are dropped once the token's exp has passed."""
+        cache = TokenCache(max_size=4)
+        cache.put("a.b.c", _claims(exp_offset=-1))
+
+        assert cache.get("a.b.c") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Least recently used entry is evicted when full."""
+        cache = TokenCache(max_size=2)
+        cache.put("t1", _claims("one"))
+        cache.put("t2", _claims("two"))
+        cache.get("t1")
+        cache.put("t3", _claims("three"))
+
+        assert cache.get("t2") is None
+        assert cache.get("t1") is not None
+        assert cache.get("t3") is not None
+
+    def test_invalid_size_rejected(self) -> None:
+        """Non-positive sizes are rejected."""
+        with pytest.raises(ValueError, match="max_size"):
+            TokenCache(max_size=0)
+
+
+class TestValidatorTokenCache:
+    """Tests for JWTValidator integration with TokenCache."""
+
+    @pytest.fixture
+    def cognito_settings(self, mock_cognito_settings: dict[str, str]) -> CognitoSettings:
+        """Create CognitoSettings from mock values."""
+        return CognitoSettings(**mock_cognito_settings)
+
+    async def test_repeat_validation_skips_decode(
+        self,
+        cognito_settings: CognitoSettings,
+        valid_token: str,
+        mock_jwks: dict[str, Any],
+    ) -> None:
+        """Second validation of the same token is served from cache."""
+        cache = TokenCache()
+        validator = JWTValidator(cognito_settings, token_cache=cache)
+
+        with patch.object(validator, "_fetch_jwks", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.return_value = mock_jwks
+            first = await validator.validate_token(valid_token)
+            second = await validator.validate_token(valid_token)
+
+        assert first == second
+        assert mock_fetch.await_count == 1
+        assert cache.hits == 1
+
+    async def test_key_rotation_clears_cache(
+        self,
+        cognito_settings: CognitoSettings,
+        valid_token: str,
+        mock_jwks: dict[str, Any],
+        mock_key_pair: MockKeyPair,
+    ) -> None:
+        """Rotating JWKS keys empties the token cache."""
+        jwks_cache = JWKSCache(cognito_settings)
+        cache = TokenCache()
+        validator = JWTValidator(cognito_settings, jwks_cache, token_cache=cache)
+
+        response = MagicMock()
+        response.json.return_value = mock_jwks
+        response.raise_for_status.return_value = None
+
+        with patch.object(jwks_cache._client, "get", new_callable=AsyncMock, return_value=response):
+            await validator.validate_token(valid_token)
+            assert len(cache) == 1
+
+            rotated = {"keys": [*mock_jwks["keys"], {**mock_key_pair.get_public_jwk(), "kid": "new-kid"}]}
+            response.json.return_value = rotated
+            await jwks_cache.refresh()
+
+        assert len(cache) == 0
@@ -21,6 +21,21 @@ def clean_env() -> Generator[None, None, None]:
         "LOG_LEVEL",
         "MAX_TOOL_CALLS",
         "JWKS_CACHE_TTL",
+        "DB_POOL_MODE",
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_POOL_TIMEOUT",
+        "DB_POOL_RECYCLE",
+        "DB_HOST_CONNECTION_BUDGET",
+        "DB_WORKERS_PER_HOST",
+        "DB_LIVENESS_CHECK",
+        "DB_IDLE_PING_THRESHOLD",
+        "DB_TRANSACTION_POOLER",
+        "DB_REPLICA_URL",
+        "DB_READ_YOUR_WRITES_WINDOW",
+        "DB_PARTITIONS_AHEAD",
+        "DB_MESSAGE_RETENTION_MONTHS",
+        "WEB_CONCURRENCY",
     ]
     # Save original values
     original = {k: os.environ.get(k) for k in env_vars}
@@ -9,6 +9,7 @@ from pydantic import ValidationError
 from app.core.config import (
     BedrockSettings,
     CognitoSettings,
+    DatabaseSettings,
     clear_settings_cache,
     get_settings,
 )
@@ -189,3 +190,75 @@ class TestValidation:
         repr_str = repr(settings)
         assert "postgresql+asyncpg://" not in repr_str
         assert "**********" in repr_str or "SecretStr" in repr_str
+
+
+# =============================================================================
+# Database Pool Sizing Tests
+# =============================================================================
+
+
+class TestDatabaseSettings:
+    """Tests for database pool configuration."""
+
+    def test_defaults(self, minimal_env: dict[str, str]) -> None:
+        """Fixed mode keeps the original 5 + 15 pool."""
+        clear_settings_cache()
+        settings = get_settings()
+
+        assert settings.database.db_pool_mode == "fixed"
+        assert settings.database.pool_limits() == (5, 15)
+        assert settings.database.db_pool_timeout == 30.0
+        assert settings.database.db_pool_recycle == -1
+        assert settings.database.db_partitions_ahead == 3
+        assert settings.database.db_message_retention_months == 0
+
+    def test_fixed_from_env(self, minimal_env: dict[str, str]) -> None:
+        """Pool settings load from environment variables."""
+        env = {"DB_POOL_SIZE": "10", "DB_MAX_OVERFLOW": "0", "DB_POOL_TIMEOUT": "5", "DB_POOL_RECYCLE": "1800"}
+        with patch.dict(os.environ, env):
+            clear_settings_cache()
+            settings = get_settings()
+
+        assert settings.database.pool_limits() == (10, 0)
+        assert settings.database.db_pool_timeout == 5.0
+        assert settings.database.db_pool_recycle == 1800
+
+    def test_auto_splits_budget_across_workers(self) -> None:
+        """Auto mode divides the host budget between workers."""
+        settings = DatabaseSettings(db_pool_mode="auto", db_host_connection_budget=100, db_workers_per_host=4)
+
+        pool_size, max_overflow = settings.pool_limits()
+
+        assert pool_size + max_overflow == 25
+        assert pool_size == 6
+
+    def test_auto_detects_web_concurrency(self, clean_env: None) -> None:
+        """Without an explicit worker count, WEB_CONCURRENCY is used."""
+        with patch.dict(os.environ, {"WEB_CONCURRENCY": "8"}):
+            settings = DatabaseSettings(db_pool_mode="auto", db_host_connection_budget=80)
+
+            assert settings.workers_per_host == 8
+            assert sum(settings.pool_limits()) == 10
+
+    def test_auto_keeps_one_connection_per_worker(self) -> None:
+        """A budget smaller than the worker count still yields a usable pool."""
+        settings = DatabaseSettings(db_pool_mode="auto", db_host_connection_budget=2, db_workers_per_host=8)
+
+        assert settings.pool_limits() == (1, 0)
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [
+            ("db_pool_size", 0),
+            ("db_max_overflow", -1),
+            ("db_pool_timeout", 0),
+            ("db_host_connection_budget", 0),
+            ("db_idle_ping_threshold", 0),
+            ("db_partitions_ahead", -1),
+            ("db_message_retention_months", -1),
+        ],
+    )
+    def test_invalid_values(self, field: str, value: int) -> None:
+        """Out-of-range pool values are rejected."""
+        with pytest.raises(ValidationError, match=field):
+            DatabaseSettings(**{field: value})
@@ -1,11 +1,15 @@
 """Tests for Secrets Manager integration."""
 
+import asyncio
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from app.core.secrets import SecretsManager, SecretsManagerError
+from app.core.secrets import AsyncSecretsManager, SecretsManager, SecretsManagerError
+
+ARN = "arn:aws:secretsmanager:us-east-1:123456:secret:test"
 
 
 class TestSecretsManager:
@@ -122,3 +126,198 @@ class TestSecretsManager:
 
         # Client should now be set
         assert manager._client is not None
+
+
+class TestAsyncSecretsManager:
+    """Tests for AsyncSecretsManager class."""
+
+    @pytest.fixture
+    def mock_boto_client(self) -> MagicMock:
+        """Create a mock boto3 Secrets Manager client."""
+        return MagicMock()
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, mock_boto_client: MagicMock) -> None:
+        """Repeated lookups within the TTL hit AWS once."""
+        manager = AsyncSecretsManager(ttl=60)
+        mock_boto_client.get_secret_value.return_value = {"SecretString": "value"}
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            assert await manager.get_secret(ARN) == "value"
+            assert await manager.get_secret(ARN) == "value"
+
+        mock_boto_client.get_secret_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refetch_after_ttl(self, mock_boto_client: MagicMock) -> None:
+        """An expired entry is fetched again."""
+        manager = AsyncSecretsManager(ttl=0)
+        mock_boto_client.get_secret_value.side_effect = [{"SecretString": "old"}, {"SecretString": "new"}]
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            assert await manager.get_secret(ARN) == "old"
+            assert await manager.get_secret(ARN) == "new"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self, mock_boto_client: MagicMock) -> None:
+        """invalidate() drops the cached value."""
+        manager = AsyncSecretsManager(ttl=60)
+        mock_boto_client.get_secret_value.return_value = {"SecretString": "value"}
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            await manager.get_secret(ARN)
+            manager.invalidate(ARN)
+            await manager.get_secret(ARN)
+
+        assert mock_boto_client.get_secret_value.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_runs_in_parallel(self, mock_boto_client: MagicMock) -> None:
+        """prefetch() issues all requests at once rather than one after another."""
+        manager = AsyncSecretsManager()
+        arns = [f"{ARN}-{i}" for i in range(3)]
+        # Each call waits for the others; sequential fetching would time out
+        barrier = threading.Barrier(len(arns), timeout=5)
+
+        def get_secret_value(SecretId: str) -> dict[str, str]:
+            barrier.wait()
+            return {"SecretString": SecretId.rsplit("-", 1)[1]}
+
+        mock_boto_client.get_secret_value.side_effect = get_secret_value
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            result = await manager.prefetch(arns)
+            assert await manager.get_secret(arns[0]) == "0"
+
+        assert result == {arns[0]: "0", arns[1]: "1", arns[2]: "2"}
+        assert mock_boto_client.get_secret_value.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_coalesce(self, mock_boto_client: MagicMock) -> None:
+        """Concurrent lookups of one secret share a single request."""
+        manager = AsyncSecretsManager()
+        mock_boto_client.get_secret_value.return_value = {"SecretString": "value"}
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            results = await asyncio.gather(*(manager.get_secret(ARN) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        mock_boto_client.get_secret_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_client_created_once_off_event_loop(self, mock_boto_client: MagicMock) -> None:
+        """The boto3 client is built in a worker thread, once for concurrent first callers."""
+        manager = AsyncSecretsManager()
+        mock_boto_client.get_secret_value.return_value = {"SecretString": "value"}
+        creating_threads = []
+
+        def create_client() -> MagicMock:
+            creating_threads.append(threading.current_thread())
+            return mock_boto_client
+
+        with patch("app.core.secrets._create_secrets_client", side_effect=create_client):
+            await manager.prefetch([f"{ARN}-{i}" for i in range(5)])
+
+        assert len(creating_threads) == 1
+        assert creating_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_retry_does_not_block(self, mock_boto_client: MagicMock) -> None:
+        """Retries back off with asyncio.sleep, never time.sleep."""
+        manager = AsyncSecretsManager(max_retries=2, retry_delay=0.01)
+        mock_boto_client.get_secret_value.side_effect = [
+            Exception("Timeout"),
+            {"SecretString": "success"},
+        ]
+
+        with (
+            patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client),
+            patch("app.core.secrets.time.sleep") as blocking_sleep,
+        ):
+            result = await manager.get_secret(ARN)
+
+        assert result == "success"
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self, mock_boto_client: MagicMock) -> None:
+        """A failed fetch raises and is retried on the next lookup."""
+        manager = AsyncSecretsManager(max_retries=0)
+        mock_boto_client.get_secret_value.side_effect = [Exception("Access denied"), {"SecretString": "value"}]
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            with pytest.raises(SecretsManagerError):
+                await manager.get_secret(ARN)
+            assert await manager.get_secret(ARN) == "value"
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_env(self, mock_boto_client: MagicMock) -> None:
+        """get_secret_or_env falls back to the environment."""
+        manager = AsyncSecretsManager(max_retries=0)
+        mock_boto_client.get_secret_value.side_effect = Exception("Access denied")
+
+        with (
+            patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client),
+            patch.dict(os.environ, {"TEST_VAR": "env-value"}),
+        ):
+            assert await manager.get_secret_or_env(ARN, "TEST_VAR") == "env-value"
+
+    @pytest.mark.asyncio
+    async def test_rotation_listener_called_on_new_version(self, mock_boto_client: MagicMock) -> None:
+        """Listeners fire when a fetch returns a new version, not on the first fetch."""
+        manager = AsyncSecretsManager(ttl=0)
+        mock_boto_client.get_secret_value.side_effect = [
+            {"SecretString": "old", "VersionId": "v1"},
+            {"SecretString": "old", "VersionId": "v1"},
+            {"SecretString": "new", "VersionId": "v2"},
+        ]
+        rotations: list[tuple[str, str]] = []
+        manager.add_rotation_listener(lambda arn, value: rotations.append((arn, value)))
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            for _ in range(3):
+                await manager.get_secret(ARN)
+
+        assert rotations == [(ARN, "new")]
+
+    @pytest.mark.asyncio
+    async def test_start_polls_for_rotation(self, mock_boto_client: MagicMock) -> None:
+        """start() re-fetches watched secrets in the background."""
+        manager = AsyncSecretsManager(ttl=60)
+        mock_boto_client.get_secret_value.side_effect = [
+            {"SecretString": "old", "VersionId": "v1"},
+            {"SecretString": "new", "VersionId": "v2"},
+        ]
+        rotated = asyncio.Event()
+        manager.add_rotation_listener(lambda arn, value: rotated.set())
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            await manager.start([ARN], interval=0.01)
+            try:
+                await asyncio.wait_for(rotated.wait(), timeout=5)
+            finally:
+                await manager.close()
+
+            assert await manager.get_secret(ARN) == "new"
+
+    @pytest.mark.asyncio
+    async def test_poll_failure_keeps_cached_value(self, mock_boto_client: MagicMock) -> None:
+        """A failed background poll leaves the cached value in place."""
+        manager = AsyncSecretsManager(max_retries=0, ttl=60)
+        polled = threading.Event()
+
+        def get_secret_value(SecretId: str) -> dict[str, str]:
+            if mock_boto_client.get_secret_value.call_count > 1:
+                polled.set()
+                raise Exception("Throttled")
+            return {"SecretString": "value", "VersionId": "v1"}
+
+        mock_boto_client.get_secret_value.side_effect = get_secret_value
+
+        with patch("app.core.secrets._create_secrets_client", return_value=mock_boto_client):
+            await manager.start([ARN], interval=0.01)
+            try:
+                await asyncio.to_thread(polled.wait, 5)
+                assert await manager.get_secret(ARN) == "value"
+            finally:
+                await manager.close()
@@ -0,0 +1,119 @@
+"""Tests for keyset-paginated conversation lists."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import InvalidCursorError
+from app.db.conversations import ConversationCursor, list_conversations
+from app.db.messages import MessageCursor
+from app.models.conversation import Conversation
+from app.models.user import User
+
+
+async def _user_with_conversations(db_session: AsyncSession, count: int, email: str) -> User:
+    """Create a user with conversations titled 0..count-1, least recently updated first.
+
+    Groups of three share updated_at, and pairs within them share created_at,
+    to exercise both tie-breakers.
+    """
+    user = User(email=email, subject_id=email)
+    db_session.add(user)
+    await db_session.flush()
+
+    start = datetime(2026, 1, 1)
+    db_session.add_all(
+        Conversation(
+            user_id=user.id,
+            title=str(i),
+            created_at=start + timedelta(seconds=i // 2),
+            updated_at=start + timedelta(minutes=i // 3),
+        )
+        for i in range(count)
+    )
+    await db_session.flush()
+    return user
+
+
+@pytest.mark.asyncio
+async def test_pages_newest_first_without_gaps(db_session: AsyncSession) -> None:
+    """Walking every page returns each conversation once, most recent first."""
+    user = await _user_with_conversations(db_session, 23, "list1@test.com")
+    other = await _user_with_conversations(db_session, 3, "list2@test.com")
+
+    titles: list[str] = []
+    cursor = None
+    while True:
+        page = await list_conversations(db_session, user.id, limit=5, before=cursor)
+        titles.extend(summary.title for summary in page.conversations)
+        if not page.has_more:
+            break
+        cursor = page.cursor
+
+    expected = await db_session.scalars(
+        select(Conversation.title)
+        .where(Conversation.user_id == user.id)
+        .order_by(Conversation.updated_at.desc(), Conversation.created_at.desc(), Conversation.id.desc())
+    )
+    assert titles == list(expected)
+    assert len(set(titles)) == 23
+    assert page.cursor is None
+    assert (await list_conversations(db_session, other.id)).conversations[0].title == "2"
+
+
+@pytest.mark.asyncio
+async def test_empty_list(db_session: AsyncSession) -> None:
+    """A user without conversations gets an empty final page."""
+    user = await _user_with_conversations(db_session, 0, "list3@test.com")
+
+    page = await list_conversations(db_session, user.id)
+
+    assert page.conversations == []
+    assert not page.has_more
+
+
+@pytest.mark.asyncio
+async def test_list_is_single_index_scan(db_session: AsyncSession) -> None:
+    """A page is one scan of the list index, with no sort and no messages access."""
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    stmt = (
+        select(
+            Conversation.id,
+            Conversation.title,
+            Conversation.updated_at,
+            Conversation.created_at,
+            Conversation.message_count,
+            Conversation.last_message_at,
+            Conversation.last_message_preview,
+        )
+        .where(Conversation.user_id == UUID(int=1))
+        .order_by(Conversation.updated_at.desc(), Conversation.created_at.desc(), Conversation.id.desc())
+        .limit(101)
+    )
+    compiled = stmt.compile(dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = "\n".join(row[0] for row in await db_session.execute(text(f"EXPLAIN {compiled}")))
+
+    assert "Index Scan using ix_conversations_user_id_updated_at" in plan
+    assert "Sort" not in plan
+    assert "messages" not in plan
+
+
+def test_cursor_round_trip() -> None:
+    """Cursors survive encoding, and garbage is rejected."""
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    cursor = ConversationCursor(updated_at=now, created_at=now - timedelta(days=1), id=UUID(int=7))
+
+    assert ConversationCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(InvalidCursorError):
+        ConversationCursor.decode("bm90LWEtY3Vyc29y")
+
+
+@pytest.mark.parametrize("cursor_type", [ConversationCursor, MessageCursor])
+def test_cursors_share_error_type(cursor_type: type[ConversationCursor | MessageCursor]) -> None:
+    """Both cursor types raise the one InvalidCursorError exported by app.db."""
+    with pytest.raises(InvalidCursorError):
+        cursor_type.decode("!")
@@ -0,0 +1,172 @@
+"""Tests for database credential rotation hooks."""
+
+import json
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import DisconnectionError
+
+from app.db import session
+from app.db.session import set_database_credentials
+
+
+@pytest.fixture(autouse=True)
+def reset_credentials() -> Generator[None, None, None]:
+    """Restore module credentials after each test."""
+    original = session._credentials
+    session._credentials = session._Credentials()
+    yield
+    session._credentials = original
+
+
+class _InvalidPasswordError(Exception):
+    """Stand-in for asyncpg's error when the server refuses a password."""
+
+    sqlstate = "28P01"
+
+
+def _secret(password: str) -> str:
+    """RDS-style secret value for the app user."""
+    return json.dumps({"username": "app", "password": password})
+
+
+async def _rotating_manager(*passwords: str) -> MagicMock:
+    """Enable rotation with a manager returning each password in turn."""
+    manager = MagicMock()
+    manager.get_secret = AsyncMock(side_effect=[_secret(password) for password in passwords])
+    manager.start = AsyncMock()
+    await session.enable_credential_rotation(manager, "arn:db")
+    return manager
+
+
+def _refusing_session() -> AsyncMock:
+    """A session whose connection is refused for its password."""
+    refused = AsyncMock()
+    refused.connection.side_effect = _InvalidPasswordError("password authentication failed")
+    return refused
+
+
+def _connect() -> tuple[MagicMock, dict[str, str]]:
+    """Run the connect hook and return the pool entry and connect params."""
+    conn_rec = MagicMock(info={})
+    cparams = {"user": "url-user", "password": "url-password"}
+    session._apply_credentials(MagicMock(), conn_rec, (), cparams)
+    return conn_rec, cparams
+
+
+def test_url_credentials_used_by_default() -> None:
+    """Without rotation, connections use the credentials from the URL."""
+    _, cparams = _connect()
+
+    assert cparams == {"user": "url-user", "password": "url-password"}
+
+
+def test_new_connections_use_current_credentials() -> None:
+    """Connections opened after an update use the new credentials."""
+    set_database_credentials("app", "secret-1")
+
+    _, cparams = _connect()
+
+    assert cparams == {"user": "app", "password": "secret-1"}
+
+
+def test_stale_connection_retired_on_checkout() -> None:
+    """Only connections opened before a rotation are replaced."""
+    set_database_credentials("app", "secret-1")
+    old_rec, _ = _connect()
+    set_database_credentials("app", "secret-2")
+    new_rec, _ = _connect()
+
+    session._retire_stale_connection(MagicMock(), new_rec, MagicMock())
+    with pytest.raises(DisconnectionError):
+        session._retire_stale_connection(MagicMock(), old_rec, MagicMock())
+
+
+def test_malformed_secret_keeps_credentials() -> None:
+    """A secret without a password does not clear working credentials."""
+    set_database_credentials("app", "secret-1")
+
+    session._set_credentials_from_secret(json.dumps({"username": "app"}))
+    session._set_credentials_from_secret("not json")
+
+    _, cparams = _connect()
+    assert cparams["password"] == "secret-1"
+
+
+@pytest.mark.asyncio
+async def test_enable_credential_rotation_follows_secret() -> None:
+    """Rotation of the watched secret updates the connect credentials."""
+    listeners = []
+    manager = MagicMock()
+    manager.get_secret = AsyncMock(return_value=json.dumps({"username": "app", "password": "p1"}))
+    manager.start = AsyncMock()
+    manager.add_rotation_listener.side_effect = listeners.append
+
+    await session.enable_credential_rotation(manager, "arn:db", interval=60)
+    assert _connect()[1]["password"] == "p1"
+
+    listeners[0]("arn:other", json.dumps({"username": "x", "password": "other"}))
+    listeners[0]("arn:db", json.dumps({"username": "app", "password": "p2"}))
+
+    assert _connect()[1] == {"user": "app", "password": "p2"}
+    manager.start.assert_awaited_once_with(["arn:db"], interval=60)
+
+
+@pytest.mark.asyncio
+async def test_refused_password_rereads_secret_and_retries() -> None:
+    """A password rotated in place is picked up on the first refused connection."""
+    manager = await _rotating_manager("p1", "p2")
+    refused, accepted = _refusing_session(), AsyncMock()
+    factory = MagicMock(side_effect=[refused, accepted])
+
+    with patch.object(session, "_session_factory", factory):
+        async with session.get_session() as db:
+            pass
+
+    assert db is accepted
+    refused.close.assert_awaited_once()
+    manager.invalidate.assert_called_once_with("arn:db")
+    assert _connect()[1]["password"] == "p2"
+
+
+@pytest.mark.asyncio
+async def test_refused_password_retried_once() -> None:
+    """If the re-read credentials are refused too, the error is raised."""
+    manager = await _rotating_manager("p1", "p1")
+    factory = MagicMock(side_effect=[_refusing_session(), _refusing_session()])
+
+    with patch.object(session, "_session_factory", factory), pytest.raises(_InvalidPasswordError):
+        async with session.get_session():
+            pass
+
+    assert factory.call_count == 2
+    assert manager.get_secret.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_secret_reread_at_most_once_per_interval() -> None:
+    """Refusals with unchanged or already replaced credentials do not re-read again."""
+    manager = await _rotating_manager("p1", "p1", "p2")
+    generation = session._credentials.generation
+
+    await session._reload_credentials(generation)
+    await session._reload_credentials(generation)
+    assert manager.get_secret.await_count == 2
+
+    session.set_database_credentials("app", "p3")
+    session._credentials.reloaded_at = 0
+    await session._reload_credentials(generation)
+    assert manager.get_secret.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_eager_connect_without_rotation() -> None:
+    """Sessions connect lazily unless credentials come from a secret."""
+    factory = MagicMock(return_value=AsyncMock())
+
+    with patch.object(session, "_session_factory", factory):
+        async with session.get_session() as db:
+            pass
+
+    db.connection.assert_not_awaited()
@@ -0,0 +1,94 @@
+"""Tests for idle-time-based connection liveness checks."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import QueuePool
+
+from app.db import session
+from app.db.session import get_session
+
+
+@pytest.fixture
+def engine() -> Engine:
+    """Single-connection SQLite engine with the idle check installed."""
+    sync_engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0)
+    session._install_idle_liveness_check(SimpleNamespace(sync_engine=sync_engine), threshold=30.0)
+    return sync_engine
+
+
+def _query(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def test_recently_used_connection_not_pinged(engine: Engine) -> None:
+    """Connections idle for less than the threshold skip the ping."""
+    with patch.object(engine.dialect, "do_ping") as do_ping:
+        _query(engine)
+        _query(engine)
+
+    do_ping.assert_not_called()
+
+
+def test_idle_connection_pinged(engine: Engine) -> None:
+    """A connection idle past the threshold is pinged once on checkout."""
+    _query(engine)
+
+    with (
+        patch.object(engine.dialect, "do_ping", return_value=True) as do_ping,
+        patch("app.db.session.time.monotonic", return_value=1e9),
+    ):
+        _query(engine)
+
+    do_ping.assert_called_once()
+
+
+def test_failed_ping_replaces_connection(engine: Engine) -> None:
+    """A dead idle connection is swapped for a new one, not handed out."""
+    _query(engine)
+    first = engine.pool._pool.queue[0].dbapi_connection
+
+    with (
+        patch.object(engine.dialect, "do_ping", side_effect=Exception("server closed the connection")),
+        patch("app.db.session.time.monotonic", return_value=1e9),
+    ):
+        _query(engine)
+
+    assert engine.pool._pool.queue[0].dbapi_connection is not first
+
+
+@pytest.fixture
+async def idle_checked_engine(test_engine: AsyncEngine) -> AsyncGenerator[AsyncEngine, None]:
+    """Single-connection Postgres engine with the idle check, used by get_session."""
+    engine = create_async_engine(test_engine.url, pool_size=1, max_overflow=0)
+    session._install_idle_liveness_check(engine, threshold=30.0)
+    with patch.object(session, "_session_factory", session._make_session_factory(engine)):
+        yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_dead_recent_connection_replaced_before_block(
+    test_engine: AsyncEngine, idle_checked_engine: AsyncEngine
+) -> None:
+    """A recently used connection that died is replaced before the session's block runs."""
+    async with get_session() as db:
+        first_pid = await db.scalar(text("SELECT pg_backend_pid()"))
+    async with test_engine.connect() as conn:
+        await conn.execute(text("SELECT pg_terminate_backend(:pid)"), {"pid": first_pid})
+    await asyncio.sleep(0.1)  # Let the client notice the closed socket
+
+    runs = 0
+    async with get_session() as db:
+        runs += 1
+        pid = await db.scalar(text("SELECT pg_backend_pid()"))
+
+    assert runs == 1
+    assert pid != first_pid
@@ -0,0 +1,265 @@
+"""Tests for keyset-paginated message history."""
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid6 import uuid7
+
+from app.db.messages import (
+    InvalidCursorError,
+    MessageCursor,
+    add_message,
+    delete_message,
+    get_message_page,
+    iter_messages,
+    touch_conversation,
+)
+from app.models.conversation import LAST_MESSAGE_PREVIEW_LENGTH, Conversation
+from app.models.message import Message
+from app.models.user import User
+
+
+async def _conversation_with_messages(db_session: AsyncSession, count: int, email: str) -> Conversation:
+    """Create a conversation with messages numbered 0..count-1, oldest first.
+
+    All messages share a timestamp, as rows inserted in one transaction do, so
+    ordering has to come from the uuid7 ids.
+    """
+    user = User(email=email, subject_id=email)
+    db_session.add(user)
+    await db_session.flush()
+
+    conversation = Conversation(user_id=user.id)
+    db_session.add(conversation)
+    await db_session.flush()
+
+    db_session.add_all(
+        Message(conversation_id=conversation.id, role="user", content=str(i), created_at=datetime(2026, 1, 1))
+        for i in range(count)
+    )
+    await db_session.flush()
+    return conversation
+
+
+def _contents(messages: list[Message]) -> list[int]:
+    return [int(message.content) for message in messages]
+
+
+@pytest.mark.asyncio
+async def test_latest_page_then_scroll_back(db_session: AsyncSession) -> None:
+    """Pages walk backwards from the newest message without gaps or repeats."""
+    conversation = await _conversation_with_messages(db_session, 25, "history1@test.com")
+
+    page = await get_message_page(db_session, conversation.id, limit=10)
+    assert _contents(page.messages) == list(range(15, 25))
+    assert page.has_more
+
+    page = await get_message_page(db_session, conversation.id, limit=10, before=page.cursor)
+    assert _contents(page.messages) == list(range(5, 15))
+
+    page = await get_message_page(db_session, conversation.id, limit=10, before=page.cursor)
+    assert _contents(page.messages) == list(range(5))
+    assert not page.has_more
+    assert page.cursor is None
+
+
+@pytest.mark.asyncio
+async def test_read_forward(db_session: AsyncSession) -> None:
+    """An after cursor returns the following messages, oldest first."""
+    conversation = await _conversation_with_messages(db_session, 6, "history2@test.com")
+    first = (await get_message_page(db_session, conversation.id, limit=6)).messages[0]
+
+    page = await get_message_page(db_session, conversation.id, limit=3, after=MessageCursor.of(first))
+
+    assert _contents(page.messages) == [1, 2, 3]
+    assert page.has_more
+    assert page.cursor == MessageCursor.of(page.messages[-1])
+
+
+@pytest.mark.asyncio
+async def test_empty_conversation(db_session: AsyncSession) -> None:
+    """A conversation without messages yields an empty final page."""
+    conversation = await _conversation_with_messages(db_session, 0, "history3@test.com")
+
+    page = await get_message_page(db_session, conversation.id)
+
+    assert page.messages == []
+    assert not page.has_more
+
+
+@pytest.mark.asyncio
+async def test_iter_messages_pages_through_everything(db_session: AsyncSession) -> None:
+    """iter_messages yields the whole history in order across pages."""
+    conversation = await _conversation_with_messages(db_session, 11, "history4@test.com")
+
+    contents = [int(message.content) async for message in iter_messages(db_session, conversation.id, page_size=4)]
+
+    assert contents == list(range(11))
+
+
+@pytest.mark.asyncio
+async def test_messages_relationship_not_loadable(db_session: AsyncSession) -> None:
+    """Conversation.messages cannot be loaded whole by accident."""
+    conversation = await _conversation_with_messages(db_session, 2, "history5@test.com")
+
+    with pytest.raises(TypeError):
+        _ = list(conversation.messages)
+
+    result = await db_session.scalars(conversation.messages.select())
+    assert _contents(list(result)) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_history_uses_composite_index(db_session: AsyncSession) -> None:
+    """The page query is served by the (conversation_id, id) index of each partition."""
+    await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+    await db_session.execute(text("SET LOCAL enable_bitmapscan = off"))
+    stmt = select(Message).where(Message.conversation_id == UUID(int=1)).order_by(Message.id.desc()).limit(50)
+    compiled = stmt.compile(dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = "\n".join(row[0] for row in await db_session.execute(text(f"EXPLAIN {compiled}")))
+
+    # Partition indexes are named e.g. messages_p2026_10_conversation_id_id_idx
+    assert "conversation_id_id" in plan
+    assert "Sort" not in plan
+
+
+def test_cursor_round_trip() -> None:
+    """Cursors survive encoding, and garbage is rejected."""
+    cursor = MessageCursor(id=uuid7())
+
+    assert MessageCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(InvalidCursorError):
+        MessageCursor.decode("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_before_and_after_exclusive(db_session: AsyncSession) -> None:
+    """Only one direction may be requested."""
+    cursor = MessageCursor(id=UUID(int=1))
+
+    with pytest.raises(ValueError, match=r"at most one"):
+        await get_message_page(db_session, UUID(int=1), before=cursor, after=cursor)
+
+
+async def _age_conversation(db_session: AsyncSession, conversation_id: UUID) -> None:
+    """Move updated_at an hour into the past."""
+    await db_session.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(updated_at=func.now() - text("interval '1 hour'"))
+    )
+
+
+async def _updated_at(db_session: AsyncSession, conversation_id: UUID) -> datetime:
+    return await db_session.scalar(select(Conversation.updated_at).where(Conversation.id == conversation_id))
+
+
+@pytest.mark.asyncio
+async def test_touch_conversation_debounces(db_session: AsyncSession) -> None:
+    """A recent bump suppresses the next one until the window passes."""
+    conversation = await _conversation_with_messages(db_session, 0, "touch1@test.com")
+    await _age_conversation(db_session, conversation.id)
+
+    assert await touch_conversation(db_session, conversation.id)
+    assert not await touch_conversation(db_session, conversation.id)
+    assert await touch_conversation(db_session, conversation.id, debounce=0)
+
+
+@pytest.mark.asyncio
+async def test_add_message_bumps_once_per_turn(db_session: AsyncSession) -> None:
+    """User messages always bump; replies within the window do not."""
+    conversation = await _conversation_with_messages(db_session, 0, "touch2@test.com")
+
+    await _age_conversation(db_session, conversation.id)
+    aged = await _updated_at(db_session, conversation.id)
+    await add_message(db_session, Message(conversation_id=conversation.id, role="user", content="hi"))
+    bumped = await _updated_at(db_session, conversation.id)
+    assert bumped > aged
+
+    # Streamed reply right after: no further UPDATE
+    await _age_conversation(db_session, conversation.id)
+    await touch_conversation(db_session, conversation.id, debounce=0)
+    before_reply = await _updated_at(db_session, conversation.id)
+    for chunk in range(3):
+        await add_message(db_session, Message(conversation_id=conversation.id, role="assistant", content=str(chunk)))
+    assert await _updated_at(db_session, conversation.id) == before_reply
+
+    # A reply after the window has passed bumps again
+    await _age_conversation(db_session, conversation.id)
+    await add_message(db_session, Message(conversation_id=conversation.id, role="tool", content="result"))
+    assert await _updated_at(db_session, conversation.id) == bumped
+
+
+@pytest.mark.asyncio
+async def test_conversations_fillfactor(db_session: AsyncSession) -> None:
+    """The conversations table leaves free space for HOT updates."""
+    options = await db_session.scalar(
+        text("SELECT reloptions FROM pg_class WHERE oid = 'faceplate.conversations'::regclass")
+    )
+
+    assert "fillfactor=80" in options
+
+
+@pytest.mark.asyncio
+async def test_add_message_maintains_summary(db_session: AsyncSession) -> None:
+    """Count, last activity and preview follow inserts; contentless messages keep the preview."""
+    conversation = await _conversation_with_messages(db_session, 0, "summary1@test.com")
+
+    await add_message(db_session, Message(conversation_id=conversation.id, role="user", content="  Hello\n\nthere  "))
+    tool_call = await add_message(db_session, Message(conversation_id=conversation.id, role="assistant", content=None))
+    await db_session.refresh(conversation)
+
+    assert conversation.message_count == 2
+    assert conversation.last_message_at == tool_call.created_at
+    assert conversation.last_message_preview == "Hello there"
+
+    await add_message(db_session, Message(conversation_id=conversation.id, role="assistant", content="x" * 500))
+    await db_session.refresh(conversation)
+    assert conversation.last_message_preview == "x" * LAST_MESSAGE_PREVIEW_LENGTH
+
+
+@pytest.mark.asyncio
+async def test_delete_message_maintains_summary(db_session: AsyncSession) -> None:
+    """Deleting recomputes the summary from the newest remaining messages."""
+    conversation = await _conversation_with_messages(db_session, 0, "summary2@test.com")
+    first = await add_message(db_session, Message(conversation_id=conversation.id, role="user", content="first"))
+    await add_message(db_session, Message(conversation_id=conversation.id, role="tool", content=None))
+    last = await add_message(db_session, Message(conversation_id=conversation.id, role="assistant", content="last"))
+    await _age_conversation(db_session, conversation.id)
+    aged = await _updated_at(db_session, conversation.id)
+
+    await delete_message(db_session, last)
+    await db_session.refresh(conversation)
+    assert conversation.message_count == 2
+    assert conversation.last_message_preview == "first"
+    assert conversation.last_message_at == first.created_at
+    assert conversation.updated_at == aged
+
+    for message in list(await db_session.scalars(conversation.messages.select())):
+        await delete_message(db_session, message)
+    await db_session.refresh(conversation)
+    assert conversation.message_count == 0
+    assert conversation.last_message_at is None
+    assert conversation.last_message_preview is None
+
+
+@pytest.mark.asyncio
+async def test_debounced_summary_update_is_hot(db_session: AsyncSession) -> None:
+    """Summary updates that leave updated_at alone are heap-only tuple updates."""
+    conversation = await _conversation_with_messages(db_session, 0, "summary3@test.com")
+    await add_message(db_session, Message(conversation_id=conversation.id, role="user", content="hi"))
+    stats = text(
+        "SELECT n_tup_upd, n_tup_hot_upd FROM pg_stat_xact_user_tables "
+        "WHERE schemaname = 'faceplate' AND relname = 'conversations'"
+    )
+    before = (await db_session.execute(stats)).one()
+
+    for chunk in range(5):
+        await add_message(db_session, Message(conversation_id=conversation.id, role="assistant", content=str(chunk)))
+
+    after = (await db_session.execute(stats)).one()
+    assert after.n_tup_upd - before.n_tup_upd == 5
+    assert after.n_tup_hot_upd - before.n_tup_hot_upd == 5
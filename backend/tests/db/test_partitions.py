@@ -0,0 +1,188 @@
+"""Tests for monthly messages partitions."""
+
+import asyncio
+from datetime import UTC, date, datetime
+from uuid import UUID
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from uuid6 import uuid7
+
+from app.db.messages import add_message
+from app.db.partitions import drop_expired_message_partitions, ensure_message_partitions
+from app.models.conversation import Conversation
+from app.models.message import (
+    INITIAL_PARTITIONS_AHEAD,
+    Message,
+    add_months,
+    message_partition_bounds,
+    message_partition_name,
+)
+from app.models.user import User
+
+
+async def _partitions(db_session: AsyncSession) -> set[str]:
+    result = await db_session.scalars(
+        text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'faceplate.messages'::regclass")
+    )
+    return {name.removeprefix("faceplate.") for name in result}
+
+
+def test_add_months() -> None:
+    """Month arithmetic wraps years in both directions."""
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 1, 1), -13) == date(2024, 12, 1)
+
+
+def test_partition_bounds_contain_uuid7() -> None:
+    """A uuid7 issued now falls in the current month's partition, and months are contiguous."""
+    month = datetime.now(UTC).date().replace(day=1)
+    lower, upper = message_partition_bounds(month)
+
+    assert lower <= uuid7() < upper
+    assert message_partition_bounds(add_months(month, 1))[0] == upper
+    assert message_partition_name(date(2026, 3, 1)) == "messages_p2026_03"
+
+
+@pytest.mark.asyncio
+async def test_create_all_makes_initial_partitions(db_session: AsyncSession) -> None:
+    """Tables made by create_all can take messages straight away."""
+    month = datetime.now(UTC).date().replace(day=1)
+
+    assert await _partitions(db_session) == {
+        message_partition_name(add_months(month, months)) for months in range(INITIAL_PARTITIONS_AHEAD + 1)
+    }
+
+
+@pytest.mark.asyncio
+async def test_ensure_creates_only_missing_partitions(db_session: AsyncSession) -> None:
+    """Future partitions are created once, up to months_ahead."""
+    month = datetime.now(UTC).date().replace(day=1)
+    later = add_months(month, INITIAL_PARTITIONS_AHEAD)
+
+    created = await ensure_message_partitions(db_session, months_ahead=2, today=later)
+
+    assert created == [message_partition_name(add_months(later, 1)), message_partition_name(add_months(later, 2))]
+    assert await ensure_message_partitions(db_session, months_ahead=2, today=later) == []
+
+
+@pytest.mark.asyncio
+async def test_ensure_skips_months_covered_by_legacy_partition(
+    db_session: AsyncSession, test_engine: AsyncEngine
+) -> None:
+    """Months inside a wider partition, like the one migration 007 attaches, are not recreated."""
+    legacy_upper, _ = message_partition_bounds(date(2020, 1, 1))
+    await db_session.execute(
+        text(
+            "CREATE TABLE faceplate.messages_legacy PARTITION OF faceplate.messages "
+            f"FOR VALUES FROM (MINVALUE) TO ('{legacy_upper}')"
+        )
+    )
+
+    created = await ensure_message_partitions(db_session, months_ahead=2, today=date(2019, 11, 1))
+    await db_session.commit()
+
+    assert created == ["messages_p2020_01"]
+    assert await drop_expired_message_partitions(test_engine, retain_months=1, today=date(2020, 3, 1)) == [
+        "messages_legacy",
+        "messages_p2020_01",
+    ]
+
+
+async def _old_and_new_messages(db_session: AsyncSession, old_month: date) -> tuple[Conversation, Conversation]:
+    """Commit two conversations with messages from old_month, one also with a new message."""
+    await ensure_message_partitions(db_session, months_ahead=0, today=old_month)
+
+    user = User(email="retention@test.com", subject_id="retention")
+    db_session.add(user)
+    await db_session.flush()
+    ongoing = Conversation(user_id=user.id)
+    abandoned = Conversation(user_id=user.id)
+    db_session.add_all([ongoing, abandoned])
+    await db_session.flush()
+
+    # Ids from old_month, as if the messages had been stored then
+    lower, _ = message_partition_bounds(old_month)
+    old_ids = (UUID(int=lower.int + n) for n in range(1, 5))
+    for conversation in (ongoing, abandoned, ongoing, abandoned):
+        await add_message(
+            db_session, Message(id=next(old_ids), conversation_id=conversation.id, role="user", content="old")
+        )
+    await add_message(db_session, Message(conversation_id=ongoing.id, role="user", content="new"))
+    await db_session.commit()
+    return ongoing, abandoned
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_partitions(db_session: AsyncSession, test_engine: AsyncEngine) -> None:
+    """Expired partitions are detached and dropped whole, and conversation summaries follow."""
+    old_month = date(2020, 1, 1)
+    ongoing, abandoned = await _old_and_new_messages(db_session, old_month)
+
+    dropped = await drop_expired_message_partitions(test_engine, retain_months=12)
+
+    assert dropped == [message_partition_name(old_month)]
+    assert message_partition_name(old_month) not in await _partitions(db_session)
+    assert await db_session.scalar(select(func.count()).select_from(Message)) == 1
+
+    await db_session.refresh(ongoing)
+    await db_session.refresh(abandoned)
+    assert ongoing.message_count == 1
+    assert ongoing.last_message_preview == "new"
+    assert abandoned.message_count == 0
+    assert abandoned.last_message_at is None
+    assert abandoned.last_message_preview is None
+
+
+@pytest.mark.asyncio
+async def test_drop_resumes_after_interrupted_round(db_session: AsyncSession, test_engine: AsyncEngine) -> None:
+    """A partition detached by a round that failed before dropping it is dropped by the next."""
+    old_month = date(2020, 1, 1)
+    name = message_partition_name(old_month)
+    _, abandoned = await _old_and_new_messages(db_session, old_month)
+    await db_session.execute(text(f'ALTER TABLE faceplate.messages DETACH PARTITION faceplate."{name}"'))
+    await db_session.commit()
+
+    assert await drop_expired_message_partitions(test_engine, retain_months=12) == [name]
+
+    await db_session.refresh(abandoned)
+    assert abandoned.message_count == 0
+    assert await db_session.scalar(text(f"SELECT to_regclass('faceplate.{name}')")) is None
+
+
+@pytest.mark.asyncio
+async def test_drop_does_not_block_message_writes(db_session: AsyncSession, test_engine: AsyncEngine) -> None:
+    """While a detach waits for an open reader, new messages can still be written."""
+    old_month = date(2020, 1, 1)
+    ongoing, _ = await _old_and_new_messages(db_session, old_month)
+
+    async with test_engine.connect() as reader:
+        await reader.execute(select(func.count()).select_from(Message))
+        drop = asyncio.create_task(drop_expired_message_partitions(test_engine, retain_months=12))
+        await asyncio.sleep(0.5)
+        assert not drop.done()
+
+        async with test_engine.begin() as writer:
+            await writer.execute(text("SET LOCAL lock_timeout = '1s'"))
+            await writer.execute(
+                Message.__table__.insert().values(id=uuid7(), conversation_id=ongoing.id, role="user", content="x")
+            )
+        await reader.rollback()
+
+    assert await asyncio.wait_for(drop, timeout=10) == [message_partition_name(old_month)]
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_recent_partitions(db_session: AsyncSession, test_engine: AsyncEngine) -> None:
+    """Partitions within the retention period are kept."""
+    month = datetime.now(UTC).date().replace(day=1)
+    last_month = add_months(month, -1)
+    await ensure_message_partitions(db_session, months_ahead=0, today=last_month)
+    await db_session.commit()
+
+    assert await drop_expired_message_partitions(test_engine, retain_months=1) == []
+    assert message_partition_name(last_month) in await _partitions(db_session)
+    with pytest.raises(ValueError, match=r"positive"):
+        await drop_expired_message_partitions(test_engine, retain_months=0)
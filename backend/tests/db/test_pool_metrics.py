@@ -0,0 +1,89 @@
+"""Tests for connection pool instrumentation."""
+
+import sqlite3
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from app.db.pool_metrics import InstrumentedPool, PoolMetrics, set_current_endpoint
+
+
+def _pool(**kwargs: object) -> InstrumentedPool:
+    """Pool over in-memory SQLite connections, no server needed."""
+    return InstrumentedPool(lambda: sqlite3.connect(":memory:", check_same_thread=False), **kwargs)
+
+
+def test_metrics_aggregate_per_endpoint() -> None:
+    """Checkouts, timeouts and hold times are tallied per endpoint."""
+    metrics = PoolMetrics()
+
+    metrics.record_checkout("GET /a", wait=0.01, overflow_in_use=0)
+    metrics.record_checkout("GET /a", wait=0.03, overflow_in_use=2)
+    metrics.record_timeout("GET /b", wait=30.0)
+    metrics.record_checkin("GET /a", held=0.5)
+
+    snapshot = metrics.snapshot()
+    endpoint_a = snapshot["endpoints"]["GET /a"]
+    assert endpoint_a["checkouts"] == 2
+    assert endpoint_a["overflow_checkouts"] == 1
+    assert endpoint_a["wait"]["max"] == 0.03
+    assert endpoint_a["wait"]["mean"] == pytest.approx(0.02)
+    assert endpoint_a["held"]["count"] == 1
+    assert snapshot["endpoints"]["GET /b"]["timeouts"] == 1
+    assert snapshot["peak_overflow"] == 2
+
+    metrics.reset()
+    assert metrics.snapshot() == {"peak_overflow": 0, "endpoints": {}}
+
+
+@pytest.mark.asyncio
+async def test_pool_records_checkout_and_hold() -> None:
+    """Checkouts and check-ins are attributed to the current endpoint."""
+    pool = _pool(pool_size=1, max_overflow=1)
+    set_current_endpoint("GET /conversations")
+
+    def use_connections() -> None:
+        first = pool.connect()
+        second = pool.connect()  # beyond pool_size: overflow
+        second.close()
+        first.close()
+
+    await greenlet_spawn(use_connections)
+
+    stats = pool.metrics.snapshot()["endpoints"]["GET /conversations"]
+    assert stats["checkouts"] == 2
+    assert stats["overflow_checkouts"] == 1
+    assert stats["held"]["count"] == 2
+    assert pool.metrics.peak_overflow == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_records_timeout() -> None:
+    """A checkout that exceeds pool_timeout is counted as a timeout."""
+    pool = _pool(pool_size=1, max_overflow=0, timeout=0.01)
+    set_current_endpoint("POST /messages")
+
+    def exhaust() -> None:
+        held = pool.connect()
+        try:
+            pool.connect()
+        finally:
+            held.close()
+
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(exhaust)
+
+    stats = pool.metrics.snapshot()["endpoints"]["POST /messages"]
+    assert stats["timeouts"] == 1
+    assert stats["wait"]["max"] >= 0.01
+
+
+def test_metrics_survive_recreate() -> None:
+    """Disposing the engine recreates the pool without losing metrics."""
+    pool = _pool(pool_size=1)
+    pool.metrics.record_checkout("GET /a", wait=0.0, overflow_in_use=0)
+
+    recreated = pool.recreate()
+
+    assert recreated.metrics is pool.metrics